@@ -34,14 +34,16 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: SupermicroRedfishConfigEntry
 ) -> bool:
     """Set up Supermicro Redfish from a config entry."""
-    session = async_get_clientsession(hass, verify_ssl=entry.data.get(CONF_VERIFY_SSL, False))
+    host = entry.data[CONF_HOST]
+    verify_ssl = entry.data.get(CONF_VERIFY_SSL, False)
+    session = async_get_clientsession(hass, verify_ssl=verify_ssl)
 
     client = SupermicroRedfishClient(
         session=session,
-        host=entry.data[CONF_HOST],
+        host=host,
         username=entry.data[CONF_USERNAME],
         password=entry.data[CONF_PASSWORD],
-        verify_ssl=entry.data.get(CONF_VERIFY_SSL, False),
+        verify_ssl=verify_ssl,
     )
 
     # Configure request throttling
@@ -64,19 +66,25 @@ async def async_setup_entry(
         raise ConfigEntryNotReady(
             translation_domain=DOMAIN,
             translation_key="connection_failed",
-            translation_placeholders={"host": entry.data[CONF_HOST]},
+            translation_placeholders={"host": host},
         ) from err
 
     # Create coordinator
     coordinator = SupermicroRedfishCoordinator(hass, entry, client)
 
     # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await client.async_disconnect()
+        raise
 
     # Store runtime data
     entry.runtime_data = SupermicroRedfishRuntimeData(
         client=client,
         coordinator=coordinator,
+        entry_data=dict(entry.data),
+        entry_options=dict(entry.options),
     )
 
     # Set up platforms
@@ -106,5 +114,23 @@ async def async_update_options(
     hass: HomeAssistant, entry: SupermicroRedfishConfigEntry
 ) -> None:
     """Handle options update."""
-    # Reload integration to apply new options
-    await hass.config_entries.async_reload(entry.entry_id)
+    runtime_data = entry.runtime_data
+
+    # Connection settings are applied at setup
+    if entry.data != runtime_data.entry_data:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    # Options can be applied to the running client and coordinator
+    old_options = runtime_data.entry_options
+    new_options = runtime_data.entry_options = dict(entry.options)
+
+    max_requests = new_options.get(
+        CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_CONCURRENT_REQUESTS
+    )
+    if max_requests != old_options.get(
+        CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_CONCURRENT_REQUESTS
+    ):
+        runtime_data.client.set_max_concurrent_requests(max_requests)
+
+    runtime_data.coordinator.update_options(new_options)
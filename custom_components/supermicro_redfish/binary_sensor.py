@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from functools import partial
+from itertools import chain
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
 from aiosupermicro.models.enums import Health, IntrusionSensor, PowerState
 from homeassistant.components.binary_sensor import (
@@ -25,7 +28,7 @@ from .const import (
     ENTITY_KEY_SYSTEM_HEALTH,
     ENTITY_KEY_SYSTEM_POWER,
 )
-from .entity import SupermicroRedfishEntity
+from .entity import SupermicroRedfishDescriptionEntity, always_available
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -41,7 +44,70 @@ class SupermicroBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes a Supermicro binary sensor entity."""
 
     value_fn: Callable[[CoordinatorData], bool | None]
-    available_fn: Callable[[CoordinatorData], bool] = lambda _: True
+    available_fn: Callable[[CoordinatorData], bool] = always_available
+    static_data: bool = False
+
+
+# Enum members are singletons, so values can be compared by identity
+_HEALTH_OK = Health.OK
+_POWER_ON = PowerState.ON
+_INTRUSION_NORMAL = IntrusionSensor.NORMAL
+
+# Attribute getters resolved once at import time
+_POWER_STATE = attrgetter("system.power_state")
+_INTRUSION_SENSOR = attrgetter("chassis.physical_security.intrusion_sensor")
+_BATTERY = attrgetter("power.battery")
+
+
+# Problem state per health value; unknown or missing health maps to None
+_HEALTH_PROBLEM: dict[Health, bool] = {
+    health: health is not _HEALTH_OK for health in Health
+}
+
+
+def _problem_value(getter: attrgetter[Any], data: CoordinatorData) -> bool | None:
+    """Return True if the health returned by getter is not OK."""
+    return _HEALTH_PROBLEM.get(getter(data))
+
+
+def _problem_description(
+    key: str,
+    translation_key: str,
+    health_path: str,
+    *,
+    enabled_default: bool = True,
+) -> SupermicroBinarySensorEntityDescription:
+    """Build a description for a health problem sensor."""
+    return SupermicroBinarySensorEntityDescription(
+        key=key,
+        translation_key=translation_key,
+        device_class=BinarySensorDeviceClass.PROBLEM,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=enabled_default,
+        static_data=True,
+        value_fn=partial(_problem_value, attrgetter(health_path)),
+    )
+
+
+def _power_on_value(data: CoordinatorData) -> bool:
+    """Return True if the system is powered on."""
+    return _POWER_STATE(data) is _POWER_ON
+
+
+def _intrusion_value(data: CoordinatorData) -> bool:
+    """Return True if the chassis intrusion sensor is triggered."""
+    return _INTRUSION_SENSOR(data) is not _INTRUSION_NORMAL
+
+
+def _battery_problem_value(data: CoordinatorData) -> bool | None:
+    """Return True if the CMOS battery is unhealthy."""
+    battery = _BATTERY(data)
+    return None if battery is None else not battery.is_healthy
+
+
+def _battery_available(data: CoordinatorData) -> bool:
+    """Return True if CMOS battery information is reported."""
+    return _BATTERY(data) is not None
 
 
 BINARY_SENSOR_DESCRIPTIONS: tuple[SupermicroBinarySensorEntityDescription, ...] = (
@@ -49,55 +115,43 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[SupermicroBinarySensorEntityDescription, ...]
     SupermicroBinarySensorEntityDescription(
         key=ENTITY_KEY_SYSTEM_POWER,
         translation_key="system_power",
+        static_data=True,
         device_class=BinarySensorDeviceClass.POWER,
-        value_fn=lambda data: data.system.power_state == PowerState.ON,
+        value_fn=_power_on_value,
     ),
-    SupermicroBinarySensorEntityDescription(
-        key=ENTITY_KEY_SYSTEM_HEALTH,
-        translation_key="system_health",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda data: data.system.status.health != Health.OK
-        if data.system.status.health
-        else None,
+    _problem_description(
+        ENTITY_KEY_SYSTEM_HEALTH, "system_health", "system.status.health"
     ),
     # Diagnostic sensors - disabled by default
-    SupermicroBinarySensorEntityDescription(
-        key=ENTITY_KEY_CHASSIS_HEALTH,
-        translation_key="chassis_health",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_registry_enabled_default=False,
-        value_fn=lambda data: data.chassis.status.health != Health.OK
-        if data.chassis.status.health
-        else None,
+    _problem_description(
+        ENTITY_KEY_CHASSIS_HEALTH,
+        "chassis_health",
+        "chassis.status.health",
+        enabled_default=False,
     ),
-    SupermicroBinarySensorEntityDescription(
-        key=ENTITY_KEY_BMC_HEALTH,
-        translation_key="bmc_health",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-        entity_category=EntityCategory.DIAGNOSTIC,
-        entity_registry_enabled_default=False,
-        value_fn=lambda data: data.manager.status.health != Health.OK
-        if data.manager.status.health
-        else None,
+    _problem_description(
+        ENTITY_KEY_BMC_HEALTH,
+        "bmc_health",
+        "manager.status.health",
+        enabled_default=False,
     ),
     SupermicroBinarySensorEntityDescription(
         key=ENTITY_KEY_INTRUSION,
         translation_key="chassis_intrusion",
+        static_data=True,
         device_class=BinarySensorDeviceClass.TAMPER,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: data.chassis.physical_security.intrusion_sensor
-        != IntrusionSensor.NORMAL,
+        value_fn=_intrusion_value,
     ),
     SupermicroBinarySensorEntityDescription(
         key=ENTITY_KEY_LICENSE,
         translation_key="license_active",
+        static_data=True,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: data.license.is_licensed,
-        available_fn=lambda data: data.license.is_valid,
+        value_fn=attrgetter("license.is_licensed"),
+        available_fn=attrgetter("license.is_valid"),
     ),
     SupermicroBinarySensorEntityDescription(
         key=ENTITY_KEY_CMOS_BATTERY,
@@ -105,29 +159,41 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[SupermicroBinarySensorEntityDescription, ...]
         device_class=BinarySensorDeviceClass.PROBLEM,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: not data.power.battery.is_healthy
-        if data.power.battery
-        else None,
-        available_fn=lambda data: data.power.battery is not None,
+        value_fn=_battery_problem_value,
+        available_fn=_battery_available,
     ),
     SupermicroBinarySensorEntityDescription(
         key=ENTITY_KEY_NTP_ENABLED,
         translation_key="ntp_enabled",
+        static_data=True,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: data.ntp.enabled,
-        available_fn=lambda data: data.ntp.is_valid,
+        value_fn=attrgetter("ntp.enabled"),
+        available_fn=attrgetter("ntp.is_valid"),
     ),
     SupermicroBinarySensorEntityDescription(
         key=ENTITY_KEY_LLDP_ENABLED,
         translation_key="lldp_enabled",
+        static_data=True,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: data.lldp.enabled,
-        available_fn=lambda data: data.lldp.is_valid,
+        value_fn=attrgetter("lldp.enabled"),
+        available_fn=attrgetter("lldp.is_valid"),
     ),
 )
 
+# Split descriptions at import time so setup only evaluates real availability checks
+_ALWAYS_AVAILABLE_DESCRIPTIONS = tuple(
+    description
+    for description in BINARY_SENSOR_DESCRIPTIONS
+    if description.available_fn is always_available
+)
+_CONDITIONAL_DESCRIPTIONS = tuple(
+    description
+    for description in BINARY_SENSOR_DESCRIPTIONS
+    if description.available_fn is not always_available
+)
+
 
 async def async_setup_entry(
     _hass: HomeAssistant,
@@ -136,20 +202,27 @@ async def async_setup_entry(
 ) -> None:
     """Set up Supermicro Redfish binary sensors."""
     coordinator: SupermicroRedfishCoordinator = entry.runtime_data.coordinator
+    data: CoordinatorData = coordinator.data
 
-    entities: list[SupermicroRedfishBinarySensor] = []
+    # Only add conditional sensors that are available on this system
+    descriptions = chain(
+        _ALWAYS_AVAILABLE_DESCRIPTIONS,
+        (
+            description
+            for description in _CONDITIONAL_DESCRIPTIONS
+            if description.available_fn(data)
+        ),
+    )
 
-    for description in BINARY_SENSOR_DESCRIPTIONS:
-        # Check if this sensor is available
-        if description.available_fn(coordinator.data):
-            entities.append(
-                SupermicroRedfishBinarySensor(coordinator, description)
-            )
+    async_add_entities(
+        SupermicroRedfishBinarySensor(coordinator, description)
+        for description in descriptions
+    )
 
-    async_add_entities(entities)
 
-
-class SupermicroRedfishBinarySensor(SupermicroRedfishEntity, BinarySensorEntity):
+class SupermicroRedfishBinarySensor(
+    SupermicroRedfishDescriptionEntity, BinarySensorEntity
+):
     """Binary sensor for Supermicro Redfish."""
 
     entity_description: SupermicroBinarySensorEntityDescription
@@ -160,18 +233,34 @@ class SupermicroRedfishBinarySensor(SupermicroRedfishEntity, BinarySensorEntity)
         description: SupermicroBinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.available_fn)
         self.entity_description = description
+        self._static_data = description.static_data
+
+        # Results are memoized per CoordinatorData instance, which is
+        # replaced on every coordinator update
+        self._value_data: CoordinatorData | None = None
+        self._value: bool | None = None
+        self._available_data: CoordinatorData | None = None
+        self._available_value = False
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        return self.entity_description.value_fn(self.coordinator.data)
+        data = self.coordinator.data
+        if data is not self._value_data:
+            self._value = self.entity_description.value_fn(data)
+            self._value_data = data
+        return self._value
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return (
-            super().available
-            and self.entity_description.available_fn(self.coordinator.data)
-        )
+        available_fn = self._available_fn
+        if available_fn is None or not self._coordinator_available:
+            return self._coordinator_available
+        data = self.coordinator.data
+        if data is not self._available_data:
+            self._available_value = available_fn(data)
+            self._available_data = data
+        return self._available_value
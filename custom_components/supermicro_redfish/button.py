@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Literal
 
 from aiosupermicro.models.enums import ResetType
 from homeassistant.components.button import (
@@ -24,10 +24,9 @@ from .const import (
     ENTITY_KEY_RESET_INTRUSION,
     ENTITY_KEY_SEND_NMI,
 )
-from .entity import SupermicroRedfishEntity
+from .entity import SupermicroRedfishDescriptionEntity, always_available
 
 if TYPE_CHECKING:
-    from aiosupermicro import SupermicroRedfishClient
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -40,8 +39,9 @@ if TYPE_CHECKING:
 class SupermicroButtonEntityDescription(ButtonEntityDescription):
     """Describes a Supermicro button entity."""
 
-    press_fn: Callable[[SupermicroRedfishClient], Coroutine[Any, Any, None]]
-    available_fn: Callable[[CoordinatorData], bool] = lambda _: True
+    action: Literal["system", "manager", "intrusion"]
+    reset_type: ResetType | None = None
+    available_fn: Callable[[CoordinatorData], bool] = always_available
 
 
 BUTTON_DESCRIPTIONS: tuple[SupermicroButtonEntityDescription, ...] = (
@@ -49,23 +49,27 @@ BUTTON_DESCRIPTIONS: tuple[SupermicroButtonEntityDescription, ...] = (
     SupermicroButtonEntityDescription(
         key=ENTITY_KEY_POWER_ON,
         translation_key="power_on",
-        press_fn=lambda client: client.async_system_reset(ResetType.ON),
+        action="system",
+        reset_type=ResetType.ON,
     ),
     SupermicroButtonEntityDescription(
         key=ENTITY_KEY_POWER_OFF,
         translation_key="power_off",
-        press_fn=lambda client: client.async_system_reset(ResetType.FORCE_OFF),
+        action="system",
+        reset_type=ResetType.FORCE_OFF,
     ),
     SupermicroButtonEntityDescription(
         key=ENTITY_KEY_GRACEFUL_SHUTDOWN,
         translation_key="graceful_shutdown",
-        press_fn=lambda client: client.async_system_reset(ResetType.GRACEFUL_SHUTDOWN),
+        action="system",
+        reset_type=ResetType.GRACEFUL_SHUTDOWN,
     ),
     SupermicroButtonEntityDescription(
         key=ENTITY_KEY_GRACEFUL_RESTART,
         translation_key="graceful_restart",
         device_class=ButtonDeviceClass.RESTART,
-        press_fn=lambda client: client.async_system_reset(ResetType.GRACEFUL_RESTART),
+        action="system",
+        reset_type=ResetType.GRACEFUL_RESTART,
     ),
     # Advanced buttons - disabled by default
     SupermicroButtonEntityDescription(
@@ -73,7 +77,8 @@ BUTTON_DESCRIPTIONS: tuple[SupermicroButtonEntityDescription, ...] = (
         translation_key="force_restart",
         device_class=ButtonDeviceClass.RESTART,
         entity_registry_enabled_default=False,
-        press_fn=lambda client: client.async_system_reset(ResetType.FORCE_RESTART),
+        action="system",
+        reset_type=ResetType.FORCE_RESTART,
     ),
     SupermicroButtonEntityDescription(
         key=ENTITY_KEY_BMC_RESTART,
@@ -81,21 +86,23 @@ BUTTON_DESCRIPTIONS: tuple[SupermicroButtonEntityDescription, ...] = (
         device_class=ButtonDeviceClass.RESTART,
         entity_category=EntityCategory.CONFIG,
         entity_registry_enabled_default=False,
-        press_fn=lambda client: client.async_manager_reset(ResetType.GRACEFUL_RESTART),
+        action="manager",
+        reset_type=ResetType.GRACEFUL_RESTART,
     ),
     SupermicroButtonEntityDescription(
         key=ENTITY_KEY_SEND_NMI,
         translation_key="send_nmi",
         entity_category=EntityCategory.CONFIG,
         entity_registry_enabled_default=False,
-        press_fn=lambda client: client.async_system_reset(ResetType.NMI),
+        action="system",
+        reset_type=ResetType.NMI,
     ),
     SupermicroButtonEntityDescription(
         key=ENTITY_KEY_RESET_INTRUSION,
         translation_key="reset_intrusion",
         entity_category=EntityCategory.CONFIG,
         entity_registry_enabled_default=False,
-        press_fn=lambda client: client.async_reset_intrusion_sensor(),
+        action="intrusion",
         available_fn=lambda data: data.chassis.physical_security is not None,
     ),
 )
@@ -109,16 +116,14 @@ async def async_setup_entry(
     """Set up Supermicro Redfish buttons."""
     coordinator: SupermicroRedfishCoordinator = entry.runtime_data.coordinator
 
-    entities: list[SupermicroRedfishButton] = []
+    # Always add buttons (availability is checked dynamically)
+    async_add_entities(
+        SupermicroRedfishButton(coordinator, description)
+        for description in BUTTON_DESCRIPTIONS
+    )
 
-    for description in BUTTON_DESCRIPTIONS:
-        # Always add buttons (availability is checked dynamically)
-        entities.append(SupermicroRedfishButton(coordinator, description))
 
-    async_add_entities(entities)
-
-
-class SupermicroRedfishButton(SupermicroRedfishEntity, ButtonEntity):
+class SupermicroRedfishButton(SupermicroRedfishDescriptionEntity, ButtonEntity):
     """Button for Supermicro Redfish."""
 
     entity_description: SupermicroButtonEntityDescription
@@ -129,19 +134,18 @@ class SupermicroRedfishButton(SupermicroRedfishEntity, ButtonEntity):
         description: SupermicroButtonEntityDescription,
     ) -> None:
         """Initialize the button."""
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.available_fn)
         self.entity_description = description
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            super().available
-            and self.entity_description.available_fn(self.coordinator.data)
-        )
-
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self.entity_description.press_fn(self.coordinator.client)
+        client = self.coordinator.client
+        description = self.entity_description
+        if description.action == "system":
+            await client.async_system_reset(description.reset_type)
+        elif description.action == "manager":
+            await client.async_manager_reset(description.reset_type)
+        else:
+            await client.async_reset_intrusion_sensor()
         self._enable_burst_mode()
         await self.coordinator.async_request_refresh()
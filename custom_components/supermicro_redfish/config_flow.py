@@ -54,6 +54,35 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_REAUTH_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME): str,
+        vol.Required(CONF_PASSWORD): str,
+    }
+)
+
+# Option validators, shared by every options form render
+SCAN_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
+)
+BURST_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=MIN_BURST_INTERVAL, max=MAX_BURST_INTERVAL),
+)
+BURST_DURATION_VALIDATOR = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=MIN_BURST_DURATION, max=MAX_BURST_DURATION),
+)
+STATIC_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=MIN_STATIC_INTERVAL, max=MAX_STATIC_INTERVAL),
+)
+CONCURRENT_REQUESTS_VALIDATOR = vol.All(
+    vol.Coerce(int),
+    vol.Range(min=MIN_CONCURRENT_REQUESTS, max=MAX_CONCURRENT_REQUESTS),
+)
+
 
 class SupermicroRedfishConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Supermicro Redfish."""
@@ -75,13 +104,13 @@ class SupermicroRedfishConfigFlow(ConfigFlow, domain=DOMAIN):
             # Check for duplicate entries
             self._async_abort_entries_match({CONF_HOST: user_input[CONF_HOST]})
 
-            # Test connection
-            error = await self._async_test_connection(user_input)
+            # Test connection and get system info for title
+            error, title = await self._async_validate_input(
+                user_input, fetch_title=True
+            )
             if error:
                 errors["base"] = error
             else:
-                # Get system info for title
-                title = await self._async_get_title(user_input)
                 return self.async_create_entry(title=title, data=user_input)
 
         return self.async_show_form(
@@ -110,7 +139,7 @@ class SupermicroRedfishConfigFlow(ConfigFlow, domain=DOMAIN):
             new_data = {**self._reauth_entry.data, **user_input}
 
             # Test connection
-            error = await self._async_test_connection(new_data)
+            error, _ = await self._async_validate_input(new_data)
             if error:
                 errors["base"] = error
             else:
@@ -121,12 +150,7 @@ class SupermicroRedfishConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_USERNAME): str,
-                    vol.Required(CONF_PASSWORD): str,
-                }
-            ),
+            data_schema=STEP_REAUTH_DATA_SCHEMA,
             errors=errors,
             description_placeholders={
                 "host": self._reauth_entry.data[CONF_HOST] if self._reauth_entry else "",
@@ -154,7 +178,7 @@ class SupermicroRedfishConfigFlow(ConfigFlow, domain=DOMAIN):
                 self._async_abort_entries_match({CONF_HOST: user_input[CONF_HOST]})
 
             # Test connection
-            error = await self._async_test_connection(user_input)
+            error, _ = await self._async_validate_input(user_input)
             if error:
                 errors["base"] = error
             else:
@@ -179,57 +203,48 @@ class SupermicroRedfishConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
-    async def _async_test_connection(self, data: dict[str, Any]) -> str | None:
-        """Test connection to the BMC and return error key if failed."""
-        session = async_get_clientsession(
-            self.hass, verify_ssl=data.get(CONF_VERIFY_SSL, False)
-        )
+    async def _async_validate_input(
+        self, data: dict[str, Any], *, fetch_title: bool = False
+    ) -> tuple[str | None, str]:
+        """Validate the connection to the BMC using a single session.
+
+        Returns the error key (or None on success) and the entry title.
+        The system is only fetched for the title if fetch_title is set.
+        """
+        host = data[CONF_HOST]
+        verify_ssl = data.get(CONF_VERIFY_SSL, False)
+        title = f"Supermicro BMC ({host})"
 
         client = SupermicroRedfishClient(
-            session=session,
-            host=data[CONF_HOST],
+            session=async_get_clientsession(self.hass, verify_ssl=verify_ssl),
+            host=host,
             username=data[CONF_USERNAME],
             password=data[CONF_PASSWORD],
-            verify_ssl=data.get(CONF_VERIFY_SSL, False),
+            verify_ssl=verify_ssl,
         )
 
         try:
             await client.async_connect()
+            system = None
+            if fetch_title:
+                try:
+                    system = await client.async_get_system()
+                except Exception:  # noqa: BLE001
+                    # System info is only used for the title
+                    system = None
             await client.async_disconnect()
         except AuthenticationError:
-            return "invalid_auth"
+            return "invalid_auth", title
         except ConnectionError:
-            return "cannot_connect"
+            return "cannot_connect", title
         except Exception:  # noqa: BLE001
             _LOGGER.exception("Unexpected error during connection test")
-            return "unknown"
-
-        return None
-
-    async def _async_get_title(self, data: dict[str, Any]) -> str:
-        """Get title for the config entry."""
-        session = async_get_clientsession(
-            self.hass, verify_ssl=data.get(CONF_VERIFY_SSL, False)
-        )
-
-        client = SupermicroRedfishClient(
-            session=session,
-            host=data[CONF_HOST],
-            username=data[CONF_USERNAME],
-            password=data[CONF_PASSWORD],
-            verify_ssl=data.get(CONF_VERIFY_SSL, False),
-        )
+            return "unknown", title
 
-        try:
-            await client.async_connect()
-            system = await client.async_get_system()
-            await client.async_disconnect()
-            if system.model and system.model != "Unknown":
-                return f"{system.manufacturer} {system.model}"
-        except Exception:  # noqa: BLE001
-            pass
+        if system is not None and system.model and system.model != "Unknown":
+            title = f"{system.manufacturer} {system.model}"
 
-        return f"Supermicro BMC ({data[CONF_HOST]})"
+        return None, title
 
     @staticmethod
     @callback
@@ -261,38 +276,23 @@ class SupermicroRedfishOptionsFlow(OptionsFlow):
                     vol.Optional(
                         CONF_SCAN_INTERVAL,
                         default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
-                    ),
+                    ): SCAN_INTERVAL_VALIDATOR,
                     vol.Optional(
                         CONF_BURST_INTERVAL,
                         default=options.get(CONF_BURST_INTERVAL, DEFAULT_BURST_INTERVAL),
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(min=MIN_BURST_INTERVAL, max=MAX_BURST_INTERVAL),
-                    ),
+                    ): BURST_INTERVAL_VALIDATOR,
                     vol.Optional(
                         CONF_BURST_DURATION,
                         default=options.get(CONF_BURST_DURATION, DEFAULT_BURST_DURATION),
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(min=MIN_BURST_DURATION, max=MAX_BURST_DURATION),
-                    ),
+                    ): BURST_DURATION_VALIDATOR,
                     vol.Optional(
                         CONF_STATIC_INTERVAL,
                         default=options.get(CONF_STATIC_INTERVAL, DEFAULT_STATIC_INTERVAL),
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(min=MIN_STATIC_INTERVAL, max=MAX_STATIC_INTERVAL),
-                    ),
+                    ): STATIC_INTERVAL_VALIDATOR,
                     vol.Optional(
                         CONF_MAX_CONCURRENT_REQUESTS,
                         default=options.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_CONCURRENT_REQUESTS),
-                    ): vol.All(
-                        vol.Coerce(int),
-                        vol.Range(min=MIN_CONCURRENT_REQUESTS, max=MAX_CONCURRENT_REQUESTS),
-                    ),
+                    ): CONCURRENT_REQUESTS_VALIDATOR,
                 }
             ),
         )
@@ -19,6 +19,12 @@ DEFAULT_BURST_INTERVAL: Final = 5
 DEFAULT_BURST_DURATION: Final = 60
 DEFAULT_STATIC_INTERVAL: Final = 300
 
+# Maximum backoff of the static interval while static data is unchanged
+STATIC_TTL_MAX_FACTOR: Final = 4
+
+# Cooldown for coalescing refresh requests after user actions (seconds)
+REQUEST_REFRESH_COOLDOWN: Final = 0.5
+
 # Option keys
 CONF_SCAN_INTERVAL: Final = "scan_interval"
 CONF_BURST_INTERVAL: Final = "burst_interval"
@@ -39,6 +45,12 @@ MIN_CONCURRENT_REQUESTS: Final = 1
 MAX_CONCURRENT_REQUESTS: Final = 10
 DEFAULT_CONCURRENT_REQUESTS: Final = 5
 
+# Resolution of numeric readings reported as entity state (decimal places).
+# At least as fine as BMC sensors resolve, so rounding drops no real data.
+POWER_PRECISION: Final = 0
+TEMPERATURE_PRECISION: Final = 1
+VOLTAGE_PRECISION: Final = 2
+
 # Connection error threshold for repair issue
 CONNECTION_ERROR_THRESHOLD: Final = 3
 
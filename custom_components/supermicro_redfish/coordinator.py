@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import time
+import math
+import sys
+from collections.abc import Callable, Mapping
+from dataclasses import replace
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import aiohttp
 from aiosupermicro.exceptions import AuthenticationError, ConnectionError
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -23,6 +29,9 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_STATIC_INTERVAL,
     DOMAIN,
+    MANUFACTURER,
+    REQUEST_REFRESH_COOLDOWN,
+    STATIC_TTL_MAX_FACTOR,
 )
 from .data import CoordinatorData
 
@@ -33,6 +42,28 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Static CoordinatorData fields whose polling backs off while unchanged.
+# The system is left out: it carries power state, health, the indicator
+# LED and the boot override, so it is refreshed every static interval.
+_BACKOFF_FIELDS = (
+    "chassis",
+    "manager",
+    "ntp",
+    "lldp",
+    "license",
+    "network_protocol",
+)
+
+
+def _get_device_name(data: CoordinatorData) -> str:
+    """Get device name from OEM board serial number."""
+    return f"{MANUFACTURER} {data.chassis.oem.board_serial_number}"
+
+
+def _get_serial_number(data: CoordinatorData) -> str | None:
+    """Get OEM board serial number for device registry."""
+    return data.chassis.oem.board_serial_number
+
 
 class SupermicroRedfishCoordinator(DataUpdateCoordinator[CoordinatorData]):
     """Coordinator for Supermicro Redfish data updates."""
@@ -47,32 +78,42 @@ class SupermicroRedfishCoordinator(DataUpdateCoordinator[CoordinatorData]):
     ) -> None:
         """Initialize the coordinator."""
         self._client = client
+        self._unique_id_prefix = sys.intern(f"{entry.entry_id}_")
         self._connection_errors = 0
-        self._last_static_update: float = 0
+        # The repair issue is persistent, so one left from before a restart
+        # is deleted on the first successful update
+        self._repair_issue_created = True
+        # Monotonic loop time; -inf forces a static refresh
+        self._last_static_update = -math.inf
+        self._last_system_update = -math.inf
         self._static_data_cache: CoordinatorData | None = None
+        self._static_version = 0
+        self._device_info: DeviceInfo | None = None
+        self._configuration_url = f"https://{entry.data['host']}"
 
         # Get intervals from options
-        self._scan_interval = int(
-            entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-        )
-        self._burst_interval = int(
-            entry.options.get(CONF_BURST_INTERVAL, DEFAULT_BURST_INTERVAL)
-        )
-        self._burst_duration = int(
-            entry.options.get(CONF_BURST_DURATION, DEFAULT_BURST_DURATION)
-        )
-        self._static_interval = int(
-            entry.options.get(CONF_STATIC_INTERVAL, DEFAULT_STATIC_INTERVAL)
-        )
+        self._read_options(entry.options)
+
+        # In-flight dynamic data request shared by overlapping refreshes
+        self._dynamic_task: asyncio.Task[Any] | None = None
 
-        # Burst mode task
+        # Burst mode task, deadline and optional settled-state check
         self._burst_task: asyncio.Task[None] | None = None
+        self._burst_end: float = 0
+        self._burst_expected: Callable[[CoordinatorData], bool] | None = None
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=self._scan_interval),
+            # Coalesce refresh requests from actions triggered in quick succession
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
 
     @property
@@ -80,40 +121,155 @@ class SupermicroRedfishCoordinator(DataUpdateCoordinator[CoordinatorData]):
         """Return the API client."""
         return self._client
 
-    def enable_burst_mode(self) -> None:
-        """Enable burst mode for faster polling after user actions."""
-        # Cancel existing burst task if any
-        if self._burst_task and not self._burst_task.done():
-            self._burst_task.cancel()
+    @property
+    def unique_id_prefix(self) -> str:
+        """Return the unique ID prefix shared by all entities of this entry."""
+        return self._unique_id_prefix
 
-        self._burst_task = self.hass.async_create_task(
-            self._async_burst_polling(),
-            name="supermicro_burst_polling",
+    @property
+    def static_version(self) -> int:
+        """Return a counter that increases with every static data refresh."""
+        return self._static_version
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information, built once per static data refresh."""
+        if self._device_info is None:
+            data = self.data
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, data.system.uuid)},
+                name=_get_device_name(data),
+                manufacturer=data.chassis.manufacturer or MANUFACTURER,
+                model=data.chassis.model,
+                serial_number=_get_serial_number(data),
+                sw_version=data.manager.firmware_version,
+                hw_version=data.chassis.model,
+                configuration_url=self._configuration_url,
+            )
+        return self._device_info
+
+    def _read_options(self, options: Mapping[str, Any]) -> None:
+        """Read polling intervals from the config entry options."""
+        self._scan_interval = int(
+            options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        )
+        self._burst_interval = int(
+            options.get(CONF_BURST_INTERVAL, DEFAULT_BURST_INTERVAL)
+        )
+        self._burst_duration = int(
+            options.get(CONF_BURST_DURATION, DEFAULT_BURST_DURATION)
         )
+        self._static_interval = int(
+            options.get(CONF_STATIC_INTERVAL, DEFAULT_STATIC_INTERVAL)
+        )
+        self._static_ttl: float = self._static_interval
+
+    def update_options(self, options: Mapping[str, Any]) -> None:
+        """Apply updated polling intervals without reloading the entry."""
+        self._read_options(options)
+        self.update_interval = timedelta(seconds=self._scan_interval)
+
+    def enable_burst_mode(
+        self, expected: Callable[[CoordinatorData], bool] | None = None
+    ) -> None:
+        """Enable burst mode for faster polling after user actions.
+
+        If expected is given, burst mode ends as soon as it returns True
+        for the refreshed data.
+        """
+        # User actions may change static data, so stop backing off
+        self._static_ttl = self._static_interval
+
+        # Extend a running burst instead of restarting it
+        self._burst_end = self.hass.loop.time() + self._burst_duration
+        self._burst_expected = expected
+
+        if self._burst_task is None or self._burst_task.done():
+            self._burst_task = self.hass.async_create_task(
+                self._async_burst_polling(),
+                name="supermicro_burst_polling",
+            )
         _LOGGER.debug("Burst mode enabled for %s seconds", self._burst_duration)
 
     async def _async_burst_polling(self) -> None:
-        """Run burst polling for a limited duration."""
-        end_time = time.time() + self._burst_duration
-        while time.time() < end_time:
-            await asyncio.sleep(self._burst_interval)
-            await self.async_request_refresh()
+        """Run burst polling until the expected state is reached or time runs out."""
+        loop = self.hass.loop
+        # Schedule polls on absolute deadlines so refresh time does not add drift
+        next_poll = loop.time()
+        while next_poll < self._burst_end:
+            next_poll += self._burst_interval
+            await asyncio.sleep(max(0, next_poll - loop.time()))
+            # Stop polling the BMC when no entities are listening
+            if not self._listeners:
+                break
+            # Refresh directly so the data is current when checked below
+            await self.async_refresh()
+            # Skip missed deadlines instead of polling back-to-back
+            next_poll = max(next_poll, loop.time())
+            expected = self._burst_expected
+            if (
+                expected is not None
+                and self.last_update_success
+                and expected(self.data)
+            ):
+                break
+        self._burst_expected = None
         _LOGGER.debug("Burst mode ended")
 
     def _should_update_static_data(self) -> bool:
         """Check if static data should be updated."""
-        return time.time() - self._last_static_update > self._static_interval
+        return self.hass.loop.time() - self._last_static_update > self._static_ttl
+
+    def _should_update_system(self) -> bool:
+        """Check if the system should be refreshed while static data backs off."""
+        return (
+            self.hass.loop.time() - self._last_system_update > self._static_interval
+        )
+
+    def _update_static_ttl(self, data: CoordinatorData) -> None:
+        """Back off static polling while static data stays unchanged.
+
+        Relies on value equality of the aiosupermicro models; models that
+        compare by identity never back off and keep the base interval.
+        """
+        cache = self._static_data_cache
+        if cache is not None and all(
+            getattr(data, field) == getattr(cache, field) for field in _BACKOFF_FIELDS
+        ):
+            self._static_ttl = min(
+                self._static_ttl * 2, self._static_interval * STATIC_TTL_MAX_FACTOR
+            )
+        else:
+            self._static_ttl = self._static_interval
+
+    async def _async_get_dynamic_data(self) -> Any:
+        """Fetch dynamic data, joining a request that is already in flight."""
+        task = self._dynamic_task
+        if task is None or task.done():
+            task = self._dynamic_task = self.hass.async_create_task(
+                self._client.async_get_dynamic_data(),
+                name="supermicro_dynamic_data",
+            )
+        # Shield so a cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
 
     async def _async_update_data(self) -> CoordinatorData:
         """Fetch data from the API."""
         try:
             # Always fetch dynamic data
-            dynamic = await self._client.async_get_dynamic_data()
+            dynamic = await self._async_get_dynamic_data()
+
+            # Index sensor members by ID so entities avoid linear lookups
+            temperatures = {t.member_id: t for t in dynamic.thermal.temperatures}
+            fans = {f.member_id: f for f in dynamic.thermal.fans}
+            voltages = {v.member_id: v for v in dynamic.power.voltages}
 
             # Fetch static data if needed (includes OEM endpoints)
             if self._should_update_static_data() or self._static_data_cache is None:
                 static = await self._client.async_get_static_data()
-                self._last_static_update = time.time()
+                self._last_static_update = self._last_system_update = (
+                    self.hass.loop.time()
+                )
 
                 data = CoordinatorData(
                     system=static.system,
@@ -127,26 +283,40 @@ class SupermicroRedfishCoordinator(DataUpdateCoordinator[CoordinatorData]):
                     snooping=dynamic.snooping,
                     license=static.license,
                     network_protocol=static.network_protocol,
+                    temperatures=temperatures,
+                    fans=fans,
+                    voltages=voltages,
                 )
+                self._update_static_ttl(data)
                 self._static_data_cache = data
+                self._static_version += 1
+                self._device_info = None
             else:
+                cache = self._static_data_cache
+                # Keep the system current while the other static data backs off
+                if self._should_update_system():
+                    system = await self._client.async_get_system()
+                    self._last_system_update = self.hass.loop.time()
+                    cache = self._static_data_cache = replace(cache, system=system)
+                    self._static_version += 1
+                    self._device_info = None
+
                 # Use cached static data with fresh dynamic data
-                data = CoordinatorData(
-                    system=self._static_data_cache.system,
-                    chassis=self._static_data_cache.chassis,
-                    manager=self._static_data_cache.manager,
+                data = replace(
+                    cache,
                     thermal=dynamic.thermal,
                     power=dynamic.power,
                     fan_mode=dynamic.fan_mode,
-                    ntp=self._static_data_cache.ntp,
-                    lldp=self._static_data_cache.lldp,
                     snooping=dynamic.snooping,
-                    license=self._static_data_cache.license,
-                    network_protocol=self._static_data_cache.network_protocol,
+                    temperatures=temperatures,
+                    fans=fans,
+                    voltages=voltages,
                 )
 
             # Reset connection error counter on success
             self._connection_errors = 0
+            if self._repair_issue_created:
+                self._async_delete_repair_issue()
 
             return data
 
@@ -165,8 +335,11 @@ class SupermicroRedfishCoordinator(DataUpdateCoordinator[CoordinatorData]):
                 err,
             )
 
-            # Create repair issue after threshold
-            if self._connection_errors >= CONNECTION_ERROR_THRESHOLD:
+            # Create repair issue once after threshold
+            if (
+                self._connection_errors >= CONNECTION_ERROR_THRESHOLD
+                and not self._repair_issue_created
+            ):
                 await self._async_create_repair_issue()
 
             raise UpdateFailed(
@@ -175,7 +348,13 @@ class SupermicroRedfishCoordinator(DataUpdateCoordinator[CoordinatorData]):
                 translation_placeholders={"host": self._client._host},
             ) from err
 
+        except (TimeoutError, aiohttp.ClientError, ValueError, KeyError) as err:
+            # The traceback is only formatted when debug logging is enabled
+            _LOGGER.debug("Unexpected error fetching data", exc_info=True)
+            raise UpdateFailed(f"Unexpected error: {err}") from err
+
         except Exception as err:
+            # Anything else (e.g. other aiosupermicro errors) still fails the update
             _LOGGER.exception("Unexpected error fetching data")
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
@@ -197,8 +376,19 @@ class SupermicroRedfishCoordinator(DataUpdateCoordinator[CoordinatorData]):
             },
             data={"entry_id": self.config_entry.entry_id},
         )
+        self._repair_issue_created = True
+
+    def _async_delete_repair_issue(self) -> None:
+        """Delete the connection failure repair issue after recovery."""
+        from homeassistant.helpers import issue_registry as ir
+
+        ir.async_delete_issue(
+            self.hass, DOMAIN, f"connection_failed_{self.config_entry.entry_id}"
+        )
+        self._repair_issue_created = False
 
     async def async_refresh_static_data(self) -> None:
         """Force refresh of static data."""
-        self._last_static_update = 0
+        self._last_static_update = -math.inf
+        self._static_ttl = self._static_interval
         await self.async_request_refresh()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from aiosupermicro import SupermicroRedfishClient
@@ -23,9 +23,12 @@ if TYPE_CHECKING:
     from .coordinator import SupermicroRedfishCoordinator
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CoordinatorData:
-    """Data class for coordinator data."""
+    """Data class for coordinator data.
+
+    Instances are immutable; entities rely on a new instance per update.
+    """
 
     system: System
     chassis: Chassis
@@ -39,6 +42,11 @@ class CoordinatorData:
     license: License
     network_protocol: NetworkProtocol
 
+    # Dynamic sensor members indexed by member ID
+    temperatures: dict[str, Any]
+    fans: dict[str, Any]
+    voltages: dict[str, Any]
+
 
 @dataclass
 class SupermicroRedfishRuntimeData:
@@ -46,3 +54,5 @@ class SupermicroRedfishRuntimeData:
 
     client: SupermicroRedfishClient
     coordinator: SupermicroRedfishCoordinator
+    entry_data: dict[str, Any]
+    entry_options: dict[str, Any]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.diagnostics import async_redact_data
@@ -14,16 +16,125 @@ if TYPE_CHECKING:
     from .data import SupermicroRedfishRuntimeData
 
 # Keys to redact from diagnostic data
-TO_REDACT = {
-    CONF_PASSWORD,
-    CONF_USERNAME,
-    "serial_number",
-    "uuid",
-    "token",
-    "session_uri",
-    "mac_address",
-    "board_serial_number",
-}
+TO_REDACT = frozenset(
+    {
+        CONF_PASSWORD,
+        CONF_USERNAME,
+        "serial_number",
+        "uuid",
+        "token",
+        "session_uri",
+        "mac_address",
+        "board_serial_number",
+    }
+)
+
+FieldMap = tuple[tuple[str, Callable[[Any], Any]], ...]
+
+
+def _str_or_none(value: Any) -> str | None:
+    """Return value as string, or None if it is not set."""
+    return str(value) if value else None
+
+
+def _status_health(obj: Any) -> str | None:
+    """Return the health of an object's status as string."""
+    return _str_or_none(obj.status.health)
+
+
+def _status_state(obj: Any) -> str | None:
+    """Return the state of an object's status as string."""
+    return _str_or_none(obj.status.state)
+
+
+def _extract(obj: Any, fields: FieldMap) -> dict[str, Any]:
+    """Build a diagnostics dict from an object using a field map."""
+    return {name: getter(obj) for name, getter in fields}
+
+
+def _extract_all(objs: Iterable[Any], fields: FieldMap) -> list[dict[str, Any]]:
+    """Build diagnostics dicts for a collection of objects."""
+    return [_extract(obj, fields) for obj in objs]
+
+
+_SYSTEM_FIELDS: FieldMap = (
+    ("id", attrgetter("id")),
+    ("name", attrgetter("name")),
+    ("manufacturer", attrgetter("manufacturer")),
+    ("model", attrgetter("model")),
+    ("power_state", lambda system: str(system.power_state)),
+    ("bios_version", attrgetter("bios_version")),
+    ("indicator_led", lambda system: str(system.indicator_led)),
+    ("processor_count", attrgetter("processor_count")),
+    ("total_memory_gib", attrgetter("total_memory_gib")),
+    ("status_health", _status_health),
+    ("status_state", _status_state),
+)
+
+_CHASSIS_FIELDS: FieldMap = (
+    ("id", attrgetter("id")),
+    ("name", attrgetter("name")),
+    ("chassis_type", lambda chassis: str(chassis.chassis_type)),
+    ("manufacturer", attrgetter("manufacturer")),
+    ("model", attrgetter("model")),
+    ("power_state", lambda chassis: str(chassis.power_state)),
+    (
+        "intrusion_sensor",
+        lambda chassis: str(chassis.physical_security.intrusion_sensor),
+    ),
+    ("status_health", _status_health),
+)
+
+_MANAGER_FIELDS: FieldMap = (
+    ("id", attrgetter("id")),
+    ("name", attrgetter("name")),
+    ("manager_type", lambda manager: str(manager.manager_type)),
+    ("firmware_version", attrgetter("firmware_version")),
+    ("model", attrgetter("model")),
+    ("status_health", _status_health),
+)
+
+_TEMPERATURE_FIELDS: FieldMap = (
+    ("member_id", attrgetter("member_id")),
+    ("name", attrgetter("name")),
+    ("reading_celsius", attrgetter("reading_celsius")),
+    ("physical_context", attrgetter("physical_context")),
+    ("status_state", _status_state),
+)
+
+_FAN_FIELDS: FieldMap = (
+    ("member_id", attrgetter("member_id")),
+    ("name", attrgetter("name")),
+    ("reading_rpm", attrgetter("reading_rpm")),
+    ("physical_context", attrgetter("physical_context")),
+    ("status_state", _status_state),
+)
+
+_VOLTAGE_FIELDS: FieldMap = (
+    ("member_id", attrgetter("member_id")),
+    ("name", attrgetter("name")),
+    ("reading_volts", attrgetter("reading_volts")),
+    ("status_state", _status_state),
+)
+
+_POWER_SUPPLY_FIELDS: FieldMap = (
+    ("member_id", attrgetter("member_id")),
+    ("name", attrgetter("name")),
+    ("power_capacity_watts", attrgetter("power_capacity_watts")),
+    ("status_state", _status_state),
+)
+
+_NETWORK_PROTOCOL_FIELDS: FieldMap = (
+    ("hostname", attrgetter("hostname")),
+    *(
+        field
+        for protocol in ("http", "https", "ssh", "ipmi", "snmp")
+        for field in (
+            (f"{protocol}_enabled", attrgetter(f"{protocol}.protocol_enabled")),
+            (f"{protocol}_port", attrgetter(f"{protocol}.port")),
+        )
+    ),
+)
 
 
 async def async_get_config_entry_diagnostics(
@@ -37,138 +148,59 @@ async def async_get_config_entry_diagnostics(
 
     # Build coordinator data dict
     data = coordinator.data
-    coordinator_data: dict[str, Any] = {}
-
-    # System
-    coordinator_data["system"] = {
-        "id": data.system.id,
-        "name": data.system.name,
-        "manufacturer": data.system.manufacturer,
-        "model": data.system.model,
-        "power_state": str(data.system.power_state),
-        "bios_version": data.system.bios_version,
-        "indicator_led": str(data.system.indicator_led),
-        "processor_count": data.system.processor_count,
-        "total_memory_gib": data.system.total_memory_gib,
-        "status_health": str(data.system.status.health) if data.system.status.health else None,
-        "status_state": str(data.system.status.state) if data.system.status.state else None,
-    }
-
-    # Chassis
-    coordinator_data["chassis"] = {
-        "id": data.chassis.id,
-        "name": data.chassis.name,
-        "chassis_type": str(data.chassis.chassis_type),
-        "manufacturer": data.chassis.manufacturer,
-        "model": data.chassis.model,
-        "power_state": str(data.chassis.power_state),
-        "intrusion_sensor": str(data.chassis.physical_security.intrusion_sensor),
-        "status_health": str(data.chassis.status.health) if data.chassis.status.health else None,
-    }
-
-    # Manager (BMC)
-    coordinator_data["manager"] = {
-        "id": data.manager.id,
-        "name": data.manager.name,
-        "manager_type": str(data.manager.manager_type),
-        "firmware_version": data.manager.firmware_version,
-        "model": data.manager.model,
-        "status_health": str(data.manager.status.health) if data.manager.status.health else None,
-    }
-
-    # Thermal
-    coordinator_data["thermal"] = {
-        "temperatures": [
-            {
-                "member_id": t.member_id,
-                "name": t.name,
-                "reading_celsius": t.reading_celsius,
-                "physical_context": t.physical_context,
-                "status_state": str(t.status.state) if t.status.state else None,
-            }
-            for t in data.thermal.temperatures
-        ],
-        "fans": [
-            {
-                "member_id": f.member_id,
-                "name": f.name,
-                "reading_rpm": f.reading_rpm,
-                "physical_context": f.physical_context,
-                "status_state": str(f.status.state) if f.status.state else None,
-            }
-            for f in data.thermal.fans
-        ],
+    coordinator_data: dict[str, Any] = {
+        "system": _extract(data.system, _SYSTEM_FIELDS),
+        "chassis": _extract(data.chassis, _CHASSIS_FIELDS),
+        "manager": _extract(data.manager, _MANAGER_FIELDS),
+        "thermal": {
+            "temperatures": _extract_all(data.thermal.temperatures, _TEMPERATURE_FIELDS),
+            "fans": _extract_all(data.thermal.fans, _FAN_FIELDS),
+        },
     }
 
     # Power
     coordinator_data["power"] = {
         "total_power_consumed_watts": data.power.total_power_consumed_watts,
-        "voltages": [
-            {
-                "member_id": v.member_id,
-                "name": v.name,
-                "reading_volts": v.reading_volts,
-                "status_state": str(v.status.state) if v.status.state else None,
-            }
-            for v in data.power.voltages
-        ],
-        "power_supplies": [
-            {
-                "member_id": ps.member_id,
-                "name": ps.name,
-                "power_capacity_watts": ps.power_capacity_watts,
-                "status_state": str(ps.status.state) if ps.status.state else None,
-            }
-            for ps in data.power.power_supplies
-        ],
+        "voltages": _extract_all(data.power.voltages, _VOLTAGE_FIELDS),
+        "power_supplies": _extract_all(data.power.power_supplies, _POWER_SUPPLY_FIELDS),
         "battery": {
             "health": data.power.battery.health,
             "state": data.power.battery.state,
         } if data.power.battery else None,
     }
 
-    # OEM
+    # OEM (sections for endpoints that failed only report their validity)
     coordinator_data["oem"] = {
         "fan_mode": {
             "mode": str(data.fan_mode.mode),
             "available_modes": [str(m) for m in data.fan_mode.available_modes],
-            "is_valid": data.fan_mode.is_valid,
-        },
+            "is_valid": True,
+        } if data.fan_mode.is_valid else {"is_valid": False},
         "ntp": {
             "enabled": data.ntp.enabled,
             "primary_server": data.ntp.primary_server,
             "secondary_server": data.ntp.secondary_server,
-            "is_valid": data.ntp.is_valid,
-        },
+            "is_valid": True,
+        } if data.ntp.is_valid else {"is_valid": False},
         "lldp": {
             "enabled": data.lldp.enabled,
-            "is_valid": data.lldp.is_valid,
-        },
+            "is_valid": True,
+        } if data.lldp.is_valid else {"is_valid": False},
         "snooping": {
             "post_code": data.snooping.post_code,
-            "is_valid": data.snooping.is_valid,
-        },
+            "is_valid": True,
+        } if data.snooping.is_valid else {"is_valid": False},
         "license": {
             "is_licensed": data.license.is_licensed,
             "license_count": len(data.license.licenses),
-            "is_valid": data.license.is_valid,
-        },
+            "is_valid": True,
+        } if data.license.is_valid else {"is_valid": False},
     }
 
     # Network Protocol
-    coordinator_data["network_protocol"] = {
-        "hostname": data.network_protocol.hostname,
-        "http_enabled": data.network_protocol.http.protocol_enabled,
-        "http_port": data.network_protocol.http.port,
-        "https_enabled": data.network_protocol.https.protocol_enabled,
-        "https_port": data.network_protocol.https.port,
-        "ssh_enabled": data.network_protocol.ssh.protocol_enabled,
-        "ssh_port": data.network_protocol.ssh.port,
-        "ipmi_enabled": data.network_protocol.ipmi.protocol_enabled,
-        "ipmi_port": data.network_protocol.ipmi.port,
-        "snmp_enabled": data.network_protocol.snmp.protocol_enabled,
-        "snmp_port": data.network_protocol.snmp.port,
-    }
+    coordinator_data["network_protocol"] = _extract(
+        data.network_protocol, _NETWORK_PROTOCOL_FIELDS
+    )
 
     # Client stats
     stats = client.stats
@@ -180,18 +212,17 @@ async def async_get_config_entry_diagnostics(
         "cache_hit_rate": round(stats.cache_hit_rate, 2),
     }
 
-    return async_redact_data(
-        {
-            "entry": {
-                "entry_id": entry.entry_id,
-                "version": entry.version,
-                "domain": entry.domain,
-                "title": entry.title,
-                "data": dict(entry.data),
-                "options": dict(entry.options),
-            },
-            "coordinator_data": coordinator_data,
-            "client_stats": client_stats,
+    # Only the config entry holds secrets; the field maps above never
+    # export identifiers such as serial numbers or UUIDs
+    return {
+        "entry": {
+            "entry_id": entry.entry_id,
+            "version": entry.version,
+            "domain": entry.domain,
+            "title": entry.title,
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
         },
-        TO_REDACT,
-    )
+        "coordinator_data": coordinator_data,
+        "client_stats": client_stats,
+    }
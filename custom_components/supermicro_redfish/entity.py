@@ -2,26 +2,24 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
-
 if TYPE_CHECKING:
-    from .coordinator import SupermicroRedfishCoordinator
-    from .data import CoordinatorData
+    from collections.abc import Callable
 
+    from homeassistant.helpers.device_registry import DeviceInfo
 
-def _get_device_name(data: CoordinatorData) -> str:
-    """Get device name from OEM board serial number."""
-    return f"{MANUFACTURER} {data.chassis.oem.board_serial_number}"
+    from .coordinator import SupermicroRedfishCoordinator
+    from .data import CoordinatorData
 
 
-def _get_serial_number(data: CoordinatorData) -> str | None:
-    """Get OEM board serial number for device registry."""
-    return data.chassis.oem.board_serial_number
+def always_available(_data: CoordinatorData) -> bool:
+    """Return True for entities that are always available."""
+    return True
 
 
 class SupermicroRedfishEntity(CoordinatorEntity["SupermicroRedfishCoordinator"]):
@@ -29,6 +27,9 @@ class SupermicroRedfishEntity(CoordinatorEntity["SupermicroRedfishCoordinator"])
 
     _attr_has_entity_name = True
 
+    # Entities that only read static data skip writes between static refreshes
+    _static_data = False
+
     def __init__(
         self,
         coordinator: SupermicroRedfishCoordinator,
@@ -39,28 +40,71 @@ class SupermicroRedfishEntity(CoordinatorEntity["SupermicroRedfishCoordinator"])
         self._entity_key = entity_key
 
         # Build unique ID from entry ID and entity key
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{entity_key}"
+        self._attr_unique_id = coordinator.unique_id_prefix + entity_key
+        self._written_update: tuple[bool, int] | None = None
+        # Cached per update so available needs no coordinator lookup
+        self._coordinator_available = coordinator.last_update_success
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        # The coordinator may have refreshed since the entity was created
+        self._coordinator_available = self.coordinator.last_update_success
+        self._update_cached_data()
+
+    def _update_cached_data(self) -> None:
+        """Update values cached from coordinator data once per update."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        success = self._coordinator_available = self.coordinator.last_update_success
+        self._update_cached_data()
+        if self._static_data:
+            update = (success, self.coordinator.static_version)
+            if update == self._written_update:
+                return
+            self._written_update = update
+        super()._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self._coordinator_available
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
-        data: CoordinatorData = self.coordinator.data
-        host: str = self.coordinator.config_entry.data["host"]
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, data.system.uuid)},
-            name=_get_device_name(data),
-            manufacturer=data.chassis.manufacturer or MANUFACTURER,
-            model=data.chassis.model,
-            serial_number=_get_serial_number(data),
-            sw_version=data.manager.firmware_version,
-            hw_version=data.chassis.model,
-            configuration_url=f"https://{host}",
-        )
+        return self.coordinator.device_info
 
-    def _enable_burst_mode(self) -> None:
+    def _enable_burst_mode(
+        self, expected: Callable[[CoordinatorData], bool] | None = None
+    ) -> None:
         """Enable burst mode after user action."""
-        self.coordinator.enable_burst_mode()
+        self.coordinator.enable_burst_mode(expected)
+
+
+class SupermicroRedfishDescriptionEntity(SupermicroRedfishEntity):
+    """Base entity whose availability comes from its description's available_fn."""
+
+    def __init__(
+        self,
+        coordinator: SupermicroRedfishCoordinator,
+        entity_key: str,
+        available_fn: Callable[[CoordinatorData], bool],
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator, entity_key)
+        # The always_available default is skipped entirely in available
+        self._available_fn = None if available_fn is always_available else available_fn
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        available_fn = self._available_fn
+        return self._coordinator_available and (
+            available_fn is None or available_fn(self.coordinator.data)
+        )
 
 
 class SupermicroRedfishSensorEntity(SupermicroRedfishEntity):
@@ -70,13 +114,29 @@ class SupermicroRedfishSensorEntity(SupermicroRedfishEntity):
         self,
         coordinator: SupermicroRedfishCoordinator,
         entity_key: str,
+        index: str,
         member_id: str,
         sensor_name: str,
     ) -> None:
-        """Initialize the sensor entity."""
+        """Initialize the sensor entity.
+
+        index names the CoordinatorData member index holding this sensor.
+        """
         super().__init__(coordinator, f"{entity_key}_{member_id}")
         self._member_id = member_id
         self._sensor_name = sensor_name
+        self._members: Callable[[CoordinatorData], dict[str, Any]] = attrgetter(index)
+        self._update_cached_data()
+
+    def _update_cached_data(self) -> None:
+        """Look up the sensor member once per update for native_value and available."""
+        self._member = self._members(self.coordinator.data).get(self._member_id)
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        member = self._member
+        return self._coordinator_available and member is not None and member.is_available
 
     @property
     def name(self) -> str:
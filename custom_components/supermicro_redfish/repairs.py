@@ -84,16 +84,13 @@ class ConnectionFailedRepairFlow(RepairsFlow):
         self, hass: HomeAssistant, data: dict[str, Any]
     ) -> str | None:
         """Test connection and return error key if failed."""
-        session = async_get_clientsession(
-            hass, verify_ssl=bool(data.get(CONF_VERIFY_SSL, False))
-        )
-
+        verify_ssl = bool(data.get(CONF_VERIFY_SSL, False))
         client = SupermicroRedfishClient(
-            session=session,
+            session=async_get_clientsession(hass, verify_ssl=verify_ssl),
             host=str(data[CONF_HOST]),
             username=str(data[CONF_USERNAME]),
             password=str(data[CONF_PASSWORD]),
-            verify_ssl=bool(data.get(CONF_VERIFY_SSL, False)),
+            verify_ssl=verify_ssl,
         )
 
         try:
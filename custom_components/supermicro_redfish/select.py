@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 from aiosupermicro.models.enums import BootSource, BootSourceEnabled, FanModeType
 from homeassistant.components.select import SelectEntity
@@ -20,7 +22,7 @@ if TYPE_CHECKING:
 
 
 # Map FanModeType values to display names
-FAN_MODE_NAMES: dict[str, str] = {
+_FAN_MODE_NAMES: dict[FanModeType, str] = {
     FanModeType.STANDARD: "Standard",
     FanModeType.FULL_SPEED: "Full Speed",
     FanModeType.OPTIMAL: "Optimal",
@@ -29,7 +31,7 @@ FAN_MODE_NAMES: dict[str, str] = {
 }
 
 # Map BootSource values to display names
-BOOT_SOURCE_NAMES: dict[str, str] = {
+_BOOT_SOURCE_NAMES: dict[BootSource, str] = {
     BootSource.NONE: "None",
     BootSource.PXE: "PXE",
     BootSource.HDD: "HDD",
@@ -45,6 +47,23 @@ BOOT_SOURCE_NAMES: dict[str, str] = {
     BootSource.UTILITIES: "Utilities",
 }
 
+# Read-only lookups keyed by the plain string value, so polls never
+# convert enum keys
+FAN_MODE_NAMES: Mapping[str, str] = MappingProxyType(
+    {str(mode): name for mode, name in _FAN_MODE_NAMES.items()}
+)
+BOOT_SOURCE_NAMES: Mapping[str, str] = MappingProxyType(
+    {str(source): name for source, name in _BOOT_SOURCE_NAMES.items()}
+)
+
+# Reverse maps: display name -> value
+FAN_MODE_VALUES: Mapping[str, str] = MappingProxyType(
+    {name: mode for mode, name in _FAN_MODE_NAMES.items()}
+)
+BOOT_SOURCE_VALUES: Mapping[str, str] = MappingProxyType(
+    {name: source for source, name in _BOOT_SOURCE_NAMES.items()}
+)
+
 
 async def async_setup_entry(
     _hass: HomeAssistant,
@@ -53,18 +72,21 @@ async def async_setup_entry(
 ) -> None:
     """Set up Supermicro Redfish select entities."""
     coordinator: SupermicroRedfishCoordinator = entry.runtime_data.coordinator
+    data = coordinator.data
 
     entities: list[SelectEntity] = []
 
     # Add fan mode select if available
-    if coordinator.data.fan_mode.is_valid:
+    if data.fan_mode.is_valid:
         entities.append(FanModeSelect(coordinator))
 
     # Add boot source select if boot options are available
-    if coordinator.data.system.boot.boot_source_options:
+    if data.system.boot.boot_source_options:
         entities.append(BootSourceSelect(coordinator))
 
-    async_add_entities(entities)
+    # Nothing to add on systems without fan mode or boot options
+    if entities:
+        async_add_entities(entities)
 
 
 class FanModeSelect(SupermicroRedfishEntity, SelectEntity):
@@ -77,37 +99,27 @@ class FanModeSelect(SupermicroRedfishEntity, SelectEntity):
     def __init__(self, coordinator: SupermicroRedfishCoordinator) -> None:
         """Initialize the fan mode select."""
         super().__init__(coordinator, ENTITY_KEY_FAN_MODE)
-
-    @property
-    def options(self) -> list[str]:
-        """Return the list of available options."""
-        available_modes = self.coordinator.data.fan_mode.available_modes
-        return [
-            FAN_MODE_NAMES.get(str(mode), str(mode))
-            for mode in available_modes
+        self._update_cached_data()
+
+    def _update_cached_data(self) -> None:
+        """Update the cached options from coordinator data."""
+        fan_mode = self.coordinator.data.fan_mode
+        self._attr_options = [
+            FAN_MODE_NAMES.get(name := str(mode), name)
+            for mode in fan_mode.available_modes
         ]
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected option."""
-        current_mode = self.coordinator.data.fan_mode.mode
-        return FAN_MODE_NAMES.get(str(current_mode), str(current_mode))
+        current = str(fan_mode.mode)
+        self._attr_current_option = FAN_MODE_NAMES.get(current, current)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         # Reverse lookup: display name -> FanModeType value
-        mode_value = None
-        for mode_type, name in FAN_MODE_NAMES.items():
-            if name == option:
-                mode_value = mode_type
-                break
-
-        if mode_value is None:
-            # Fallback: use option as-is if not found in mapping
-            mode_value = option
+        # Fallback: use option as-is if not found in mapping
+        mode_value = FAN_MODE_VALUES.get(option, option)
 
         await self.coordinator.client.async_set_fan_mode(mode_value)
-        self._enable_burst_mode()
+        # Fan mode is part of the dynamic data, so burst mode can stop once it applies
+        self._enable_burst_mode(lambda data: data.fan_mode.mode == mode_value)
         await self.coordinator.async_request_refresh()
 
 
@@ -117,47 +129,34 @@ class BootSourceSelect(SupermicroRedfishEntity, SelectEntity):
     _attr_translation_key = "boot_source"
     _attr_entity_category = EntityCategory.CONFIG
     _attr_entity_registry_enabled_default = False
+    _static_data = True
 
     def __init__(self, coordinator: SupermicroRedfishCoordinator) -> None:
         """Initialize the boot source select."""
         super().__init__(coordinator, ENTITY_KEY_BOOT_SOURCE)
+        self._update_cached_data()
 
-    @property
-    def options(self) -> list[str]:
-        """Return the list of available options."""
-        boot_options = self.coordinator.data.system.boot.boot_source_options
-        return [
+    def _update_cached_data(self) -> None:
+        """Update the cached options from coordinator data."""
+        boot = self.coordinator.data.system.boot
+        self._attr_options = [
             BOOT_SOURCE_NAMES.get(opt, opt)
-            for opt in boot_options
+            for opt in boot.boot_source_options
         ]
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected option."""
-        current_target = self.coordinator.data.system.boot.boot_source_override_target
-        if current_target is None:
-            return None
-        return BOOT_SOURCE_NAMES.get(str(current_target), str(current_target))
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return extra state attributes."""
-        boot = self.coordinator.data.system.boot
-        return {
+        current_target = boot.boot_source_override_target
+        self._attr_current_option = (
+            None
+            if current_target is None
+            else BOOT_SOURCE_NAMES.get(name := str(current_target), name)
+        )
+        self._attr_extra_state_attributes = {
             "boot_override_enabled": str(boot.boot_source_override_enabled),
         }
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         # Reverse lookup: display name -> BootSource value
-        target_value = None
-        for boot_source, name in BOOT_SOURCE_NAMES.items():
-            if name == option:
-                target_value = boot_source
-                break
-
-        if target_value is None:
-            target_value = option
+        target_value = BOOT_SOURCE_VALUES.get(option, option)
 
         # Set boot source with "Once" enabled
         await self.coordinator.client.async_set_boot_source(
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
@@ -26,8 +27,16 @@ from .const import (
     ENTITY_KEY_BMC_FIRMWARE,
     ENTITY_KEY_POST_CODE,
     ENTITY_KEY_POWER_CONSUMPTION,
+    POWER_PRECISION,
+    TEMPERATURE_PRECISION,
+    VOLTAGE_PRECISION,
+)
+from .entity import (
+    SupermicroRedfishDescriptionEntity,
+    SupermicroRedfishEntity,
+    SupermicroRedfishSensorEntity,
+    always_available,
 )
-from .entity import SupermicroRedfishEntity, SupermicroRedfishSensorEntity
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -43,7 +52,30 @@ class SupermicroSensorEntityDescription(SensorEntityDescription):
     """Describes a Supermicro sensor entity."""
 
     value_fn: Callable[[CoordinatorData], Any]
-    available_fn: Callable[[CoordinatorData], bool] = lambda _: True
+    available_fn: Callable[[CoordinatorData], bool] = always_available
+    static_data: bool = False
+
+
+# Attribute getters resolved once at import time
+_POWER_CONSUMED = attrgetter("power.total_power_consumed_watts")
+
+
+def _quantize(value: float | None, ndigits: int) -> float | None:
+    """Round a reading to the resolution reported as entity state.
+
+    Unchanged readings then produce no state change or recorder write.
+    """
+    return None if value is None else round(value, ndigits)
+
+
+def _power_consumed(data: CoordinatorData) -> float | None:
+    """Return total power consumption at the reported resolution."""
+    return _quantize(_POWER_CONSUMED(data), POWER_PRECISION)
+
+
+def _power_consumption_available(data: CoordinatorData) -> bool:
+    """Return True if the BMC reports total power consumption."""
+    return _POWER_CONSUMED(data) is not None
 
 
 SENSOR_DESCRIPTIONS: tuple[SupermicroSensorEntityDescription, ...] = (
@@ -54,31 +86,34 @@ SENSOR_DESCRIPTIONS: tuple[SupermicroSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.WATT,
-        value_fn=lambda data: data.power.total_power_consumed_watts,
-        available_fn=lambda data: data.power.total_power_consumed_watts is not None,
+        suggested_display_precision=POWER_PRECISION,
+        value_fn=_power_consumed,
+        available_fn=_power_consumption_available,
     ),
     # Diagnostic sensors - disabled by default
     SupermicroSensorEntityDescription(
         key=ENTITY_KEY_BIOS_VERSION,
         translation_key="bios_version",
+        static_data=True,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: data.system.bios_version,
+        value_fn=attrgetter("system.bios_version"),
     ),
     SupermicroSensorEntityDescription(
         key=ENTITY_KEY_BMC_FIRMWARE,
         translation_key="bmc_firmware",
+        static_data=True,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: data.manager.firmware_version,
+        value_fn=attrgetter("manager.firmware_version"),
     ),
     SupermicroSensorEntityDescription(
         key=ENTITY_KEY_POST_CODE,
         translation_key="post_code",
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda data: data.snooping.post_code,
-        available_fn=lambda data: data.snooping.is_valid,
+        value_fn=attrgetter("snooping.post_code"),
+        available_fn=attrgetter("snooping.is_valid"),
     ),
     SupermicroSensorEntityDescription(
         key=ENTITY_KEY_API_RESPONSE_TIME,
@@ -102,49 +137,34 @@ async def async_setup_entry(
     coordinator: SupermicroRedfishCoordinator = entry.runtime_data.coordinator
     data: CoordinatorData = coordinator.data
 
-    entities: list[SensorEntity] = []
-
     # Add static sensors
-    for description in SENSOR_DESCRIPTIONS:
-        if description.key == ENTITY_KEY_API_RESPONSE_TIME:
-            entities.append(ApiResponseTimeSensor(coordinator, description))
-        elif description.available_fn(data):
-            entities.append(SupermicroRedfishSensor(coordinator, description))
-
-    # Add dynamic temperature sensors
-    for temp in data.thermal.available_temperatures:
-        entities.append(
-            TemperatureSensor(
-                coordinator,
-                temp.member_id,
-                temp.name,
-            )
-        )
-
-    # Add dynamic fan sensors
-    for fan in data.thermal.available_fans:
-        entities.append(
-            FanSensor(
-                coordinator,
-                fan.member_id,
-                fan.name,
-            )
-        )
-
-    # Add dynamic voltage sensors
-    for voltage in data.power.available_voltages:
-        entities.append(
-            VoltageSensor(
-                coordinator,
-                voltage.member_id,
-                voltage.name,
-            )
-        )
+    entities: list[SensorEntity] = [
+        ApiResponseTimeSensor(coordinator, description)
+        if description.key == ENTITY_KEY_API_RESPONSE_TIME
+        else SupermicroRedfishSensor(coordinator, description)
+        for description in SENSOR_DESCRIPTIONS
+        if description.key == ENTITY_KEY_API_RESPONSE_TIME
+        or description.available_fn(data)
+    ]
+
+    # Add dynamic temperature, fan and voltage sensors
+    entities.extend(
+        TemperatureSensor(coordinator, temp.member_id, temp.name)
+        for temp in data.thermal.available_temperatures
+    )
+    entities.extend(
+        FanSensor(coordinator, fan.member_id, fan.name)
+        for fan in data.thermal.available_fans
+    )
+    entities.extend(
+        VoltageSensor(coordinator, voltage.member_id, voltage.name)
+        for voltage in data.power.available_voltages
+    )
 
     async_add_entities(entities)
 
 
-class SupermicroRedfishSensor(SupermicroRedfishEntity, SensorEntity):
+class SupermicroRedfishSensor(SupermicroRedfishDescriptionEntity, SensorEntity):
     """Sensor for Supermicro Redfish."""
 
     entity_description: SupermicroSensorEntityDescription
@@ -155,21 +175,15 @@ class SupermicroRedfishSensor(SupermicroRedfishEntity, SensorEntity):
         description: SupermicroSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.available_fn)
         self.entity_description = description
+        self._static_data = description.static_data
+        self._value_fn = description.value_fn
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        return self.entity_description.value_fn(self.coordinator.data)
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            super().available
-            and self.entity_description.available_fn(self.coordinator.data)
-        )
+        return self._value_fn(self.coordinator.data)
 
 
 class ApiResponseTimeSensor(SupermicroRedfishEntity, SensorEntity):
@@ -185,11 +199,13 @@ class ApiResponseTimeSensor(SupermicroRedfishEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator, description.key)
         self.entity_description = description
+        self._update_cached_data()
 
-    @property
-    def native_value(self) -> float:
-        """Return the average API response time."""
-        return float(round(self.coordinator.client.stats.avg_response_time_ms, 1))
+    def _update_cached_data(self) -> None:
+        """Update the cached response time from the client stats."""
+        self._attr_native_value = round(
+            self.coordinator.client.stats.avg_response_time_ms, 1
+        )
 
 
 class TemperatureSensor(SupermicroRedfishSensorEntity, SensorEntity):
@@ -198,6 +214,7 @@ class TemperatureSensor(SupermicroRedfishSensorEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+    _attr_suggested_display_precision = TEMPERATURE_PRECISION
 
     def __init__(
         self,
@@ -206,21 +223,13 @@ class TemperatureSensor(SupermicroRedfishSensorEntity, SensorEntity):
         sensor_name: str,
     ) -> None:
         """Initialize the temperature sensor."""
-        super().__init__(coordinator, "temperature", member_id, sensor_name)
+        super().__init__(coordinator, "temperature", "temperatures", member_id, sensor_name)
 
     @property
     def native_value(self) -> float | None:
         """Return the temperature reading."""
-        temp = self.coordinator.data.thermal.get_temperature(self._member_id)
-        return temp.reading_celsius if temp else None
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not super().available:
-            return False
-        temp = self.coordinator.data.thermal.get_temperature(self._member_id)
-        return temp is not None and temp.is_available
+        temp = self._member
+        return _quantize(temp.reading_celsius, TEMPERATURE_PRECISION) if temp else None
 
 
 class FanSensor(SupermicroRedfishSensorEntity, SensorEntity):
@@ -237,22 +246,14 @@ class FanSensor(SupermicroRedfishSensorEntity, SensorEntity):
         sensor_name: str,
     ) -> None:
         """Initialize the fan sensor."""
-        super().__init__(coordinator, "fan", member_id, sensor_name)
+        super().__init__(coordinator, "fan", "fans", member_id, sensor_name)
 
     @property
     def native_value(self) -> int | None:
         """Return the fan speed reading."""
-        fan = self.coordinator.data.thermal.get_fan(self._member_id)
+        fan = self._member
         return fan.reading_rpm if fan else None
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not super().available:
-            return False
-        fan = self.coordinator.data.thermal.get_fan(self._member_id)
-        return fan is not None and fan.is_available
-
 
 class VoltageSensor(SupermicroRedfishSensorEntity, SensorEntity):
     """Voltage sensor for Supermicro Redfish."""
@@ -260,6 +261,7 @@ class VoltageSensor(SupermicroRedfishSensorEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
+    _attr_suggested_display_precision = VOLTAGE_PRECISION
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_entity_registry_enabled_default = False
 
@@ -270,18 +272,10 @@ class VoltageSensor(SupermicroRedfishSensorEntity, SensorEntity):
         sensor_name: str,
     ) -> None:
         """Initialize the voltage sensor."""
-        super().__init__(coordinator, "voltage", member_id, sensor_name)
+        super().__init__(coordinator, "voltage", "voltages", member_id, sensor_name)
 
     @property
     def native_value(self) -> float | None:
         """Return the voltage reading."""
-        voltage = self.coordinator.data.power.get_voltage(self._member_id)
-        return voltage.reading_volts if voltage else None
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        if not super().available:
-            return False
-        voltage = self.coordinator.data.power.get_voltage(self._member_id)
-        return voltage is not None and voltage.is_available
+        voltage = self._member
+        return _quantize(voltage.reading_volts, VOLTAGE_PRECISION) if voltage else None
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
 from aiosupermicro.models.enums import IndicatorLED
@@ -17,7 +18,7 @@ from .const import (
     ENTITY_KEY_SNMP_PROTOCOL,
     ENTITY_KEY_SSH_PROTOCOL,
 )
-from .entity import SupermicroRedfishEntity
+from .entity import SupermicroRedfishDescriptionEntity, always_available
 
 if TYPE_CHECKING:
     from aiosupermicro import SupermicroRedfishClient
@@ -36,7 +37,29 @@ class SupermicroSwitchEntityDescription(SwitchEntityDescription):
     value_fn: Callable[[CoordinatorData], bool | None]
     turn_on_fn: Callable[[SupermicroRedfishClient], Coroutine[Any, Any, None]]
     turn_off_fn: Callable[[SupermicroRedfishClient], Coroutine[Any, Any, None]]
-    available_fn: Callable[[CoordinatorData], bool] = lambda _: True
+    available_fn: Callable[[CoordinatorData], bool] = always_available
+    static_data: bool = False
+
+
+_PROTOCOLS_VALID = attrgetter("network_protocol.is_valid")
+_LED_ON_STATES = frozenset({IndicatorLED.LIT, IndicatorLED.BLINKING})
+
+
+def _protocol_description(
+    key: str, protocol: str
+) -> SupermicroSwitchEntityDescription:
+    """Build a description for a network protocol switch."""
+    return SupermicroSwitchEntityDescription(
+        key=key,
+        translation_key=key,
+        static_data=True,
+        entity_category=EntityCategory.CONFIG,
+        entity_registry_enabled_default=False,
+        value_fn=attrgetter(f"network_protocol.{protocol.lower()}.protocol_enabled"),
+        turn_on_fn=lambda client: client.async_set_protocol_enabled(protocol, True),
+        turn_off_fn=lambda client: client.async_set_protocol_enabled(protocol, False),
+        available_fn=_PROTOCOLS_VALID,
+    )
 
 
 SWITCH_DESCRIPTIONS: tuple[SupermicroSwitchEntityDescription, ...] = (
@@ -44,52 +67,21 @@ SWITCH_DESCRIPTIONS: tuple[SupermicroSwitchEntityDescription, ...] = (
     SupermicroSwitchEntityDescription(
         key=ENTITY_KEY_INDICATOR_LED,
         translation_key="indicator_led",
+        static_data=True,
         entity_category=EntityCategory.CONFIG,
-        value_fn=lambda data: data.system.indicator_led == IndicatorLED.LIT
-        or data.system.indicator_led == IndicatorLED.BLINKING,
+        value_fn=lambda data: data.system.indicator_led in _LED_ON_STATES,
         turn_on_fn=lambda client: client.async_set_indicator_led(IndicatorLED.LIT),
         turn_off_fn=lambda client: client.async_set_indicator_led(IndicatorLED.OFF),
     ),
     # Protocol switches - disabled by default
-    SupermicroSwitchEntityDescription(
-        key=ENTITY_KEY_HTTP_PROTOCOL,
-        translation_key="http_protocol",
-        entity_category=EntityCategory.CONFIG,
-        entity_registry_enabled_default=False,
-        value_fn=lambda data: data.network_protocol.http.protocol_enabled,
-        turn_on_fn=lambda client: client.async_set_protocol_enabled("HTTP", True),
-        turn_off_fn=lambda client: client.async_set_protocol_enabled("HTTP", False),
-        available_fn=lambda data: data.network_protocol.is_valid,
-    ),
-    SupermicroSwitchEntityDescription(
-        key=ENTITY_KEY_SSH_PROTOCOL,
-        translation_key="ssh_protocol",
-        entity_category=EntityCategory.CONFIG,
-        entity_registry_enabled_default=False,
-        value_fn=lambda data: data.network_protocol.ssh.protocol_enabled,
-        turn_on_fn=lambda client: client.async_set_protocol_enabled("SSH", True),
-        turn_off_fn=lambda client: client.async_set_protocol_enabled("SSH", False),
-        available_fn=lambda data: data.network_protocol.is_valid,
-    ),
-    SupermicroSwitchEntityDescription(
-        key=ENTITY_KEY_IPMI_PROTOCOL,
-        translation_key="ipmi_protocol",
-        entity_category=EntityCategory.CONFIG,
-        entity_registry_enabled_default=False,
-        value_fn=lambda data: data.network_protocol.ipmi.protocol_enabled,
-        turn_on_fn=lambda client: client.async_set_protocol_enabled("IPMI", True),
-        turn_off_fn=lambda client: client.async_set_protocol_enabled("IPMI", False),
-        available_fn=lambda data: data.network_protocol.is_valid,
-    ),
-    SupermicroSwitchEntityDescription(
-        key=ENTITY_KEY_SNMP_PROTOCOL,
-        translation_key="snmp_protocol",
-        entity_category=EntityCategory.CONFIG,
-        entity_registry_enabled_default=False,
-        value_fn=lambda data: data.network_protocol.snmp.protocol_enabled,
-        turn_on_fn=lambda client: client.async_set_protocol_enabled("SNMP", True),
-        turn_off_fn=lambda client: client.async_set_protocol_enabled("SNMP", False),
-        available_fn=lambda data: data.network_protocol.is_valid,
+    *(
+        _protocol_description(key, protocol)
+        for key, protocol in (
+            (ENTITY_KEY_HTTP_PROTOCOL, "HTTP"),
+            (ENTITY_KEY_SSH_PROTOCOL, "SSH"),
+            (ENTITY_KEY_IPMI_PROTOCOL, "IPMI"),
+            (ENTITY_KEY_SNMP_PROTOCOL, "SNMP"),
+        )
     ),
 )
 
@@ -101,17 +93,19 @@ async def async_setup_entry(
 ) -> None:
     """Set up Supermicro Redfish switches."""
     coordinator: SupermicroRedfishCoordinator = entry.runtime_data.coordinator
+    data = coordinator.data
 
     entities: list[SupermicroRedfishSwitch] = []
 
     for description in SWITCH_DESCRIPTIONS:
-        if description.available_fn(coordinator.data):
+        if description.available_fn(data):
             entities.append(SupermicroRedfishSwitch(coordinator, description))
 
-    async_add_entities(entities)
+    if entities:
+        async_add_entities(entities)
 
 
-class SupermicroRedfishSwitch(SupermicroRedfishEntity, SwitchEntity):
+class SupermicroRedfishSwitch(SupermicroRedfishDescriptionEntity, SwitchEntity):
     """Switch for Supermicro Redfish."""
 
     entity_description: SupermicroSwitchEntityDescription
@@ -122,21 +116,15 @@ class SupermicroRedfishSwitch(SupermicroRedfishEntity, SwitchEntity):
         description: SupermicroSwitchEntityDescription,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator, description.key)
+        super().__init__(coordinator, description.key, description.available_fn)
         self.entity_description = description
+        self._static_data = description.static_data
+        self._value_fn = description.value_fn
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        return self.entity_description.value_fn(self.coordinator.data)
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return (
-            super().available
-            and self.entity_description.available_fn(self.coordinator.data)
-        )
+        return self._value_fn(self.coordinator.data)
 
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn the switch on."""
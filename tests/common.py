@@ -0,0 +1,55 @@
+"""Shared helpers for Supermicro Redfish tests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from aiosupermicro import SupermicroRedfishClient
+
+# Client attributes mocks may set; instance attributes assigned in the
+# client's __init__ are not visible on the class and are listed explicitly
+CLIENT_SPEC: tuple[str, ...] = (*dir(SupermicroRedfishClient), "_host", "stats")
+
+
+@dataclass(frozen=True, slots=True)
+class FakeValue:
+    """Stand-in for an enum member exposing ``value``."""
+
+    value: str
+
+
+@dataclass(frozen=True, slots=True)
+class FakeStatus:
+    """Stand-in for a Redfish Status object."""
+
+    health: FakeValue = FakeValue("OK")
+    state: FakeValue = FakeValue("Enabled")
+
+
+@dataclass(frozen=True, slots=True)
+class FakeBoot:
+    """Stand-in for the System boot settings."""
+
+    boot_source_override_target: str | None = None
+    boot_source_override_enabled: FakeValue = FakeValue("Disabled")
+    boot_source_options: tuple[str, ...] = ("Pxe", "Hdd", "Cd", "Usb", "BiosSetup")
+
+
+@dataclass(frozen=True, slots=True)
+class FakeSystem:
+    """Stand-in for the aiosupermicro System model."""
+
+    id: str = "1"
+    name: str = "System"
+    uuid: str = "12345678-1234-1234-1234-123456789012"
+    manufacturer: str = "Supermicro"
+    model: str = "X12DPi-N6"
+    serial_number: str = "S123456789"
+    power_state: FakeValue = FakeValue("On")
+    bios_version: str = "2.1"
+    indicator_led: FakeValue = FakeValue("Off")
+    processor_count: int = 2
+    total_memory_gib: int = 256
+    status: FakeStatus = FakeStatus()
+    boot: FakeBoot = FakeBoot()
+    is_valid: bool = True
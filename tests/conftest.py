@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import Generator, Mapping
+from types import MappingProxyType
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.supermicro_redfish.const import CONF_VERIFY_SSL, DOMAIN
 
+from .common import CLIENT_SPEC, FakeSystem
+
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 
@@ -21,51 +25,53 @@ def auto_enable_custom_integrations(
     """Enable custom integrations for all tests."""
 
 
-@pytest.fixture
-def mock_config_entry_data() -> dict[str, Any]:
+@pytest.fixture(scope="module")
+def mock_config_entry_data() -> Mapping[str, Any]:
     """Return mock config entry data."""
-    return {
-        CONF_HOST: "192.168.1.100",
-        CONF_USERNAME: "ADMIN",
-        CONF_PASSWORD: "password",
-        CONF_VERIFY_SSL: False,
-    }
+    return MappingProxyType(
+        {
+            CONF_HOST: "192.168.1.100",
+            CONF_USERNAME: "ADMIN",
+            CONF_PASSWORD: "password",
+            CONF_VERIFY_SSL: False,
+        }
+    )
+
+
+@pytest.fixture
+def mock_config_entry(mock_config_entry_data: Mapping[str, Any]) -> MockConfigEntry:
+    """Return a mock config entry.
+
+    The entry is not added to hass; tests that need it registered call
+    add_to_hass themselves.
+    """
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="Test",
+        data=mock_config_entry_data,
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_system() -> FakeSystem:
+    """Return mock System object.
+
+    The system is read-only in tests, so one frozen instance is shared
+    across the session.
+    """
+    return FakeSystem()
 
 
 @pytest.fixture
-def mock_system() -> MagicMock:
-    """Return mock System object."""
-    system = MagicMock()
-    system.id = "1"
-    system.name = "System"
-    system.uuid = "12345678-1234-1234-1234-123456789012"
-    system.manufacturer = "Supermicro"
-    system.model = "X12DPi-N6"
-    system.serial_number = "S123456789"
-    system.power_state = MagicMock()
-    system.power_state.value = "On"
-    system.bios_version = "2.1"
-    system.indicator_led = MagicMock()
-    system.indicator_led.value = "Off"
-    system.processor_count = 2
-    system.total_memory_gib = 256
-    system.status = MagicMock()
-    system.status.health = MagicMock()
-    system.status.health.value = "OK"
-    system.status.state = MagicMock()
-    system.status.state.value = "Enabled"
-    system.boot = MagicMock()
-    system.boot.boot_source_override_target = None
-    system.boot.boot_source_override_enabled = MagicMock()
-    system.boot.boot_source_options = ["Pxe", "Hdd", "Cd", "Usb", "BiosSetup"]
-    system.is_valid = True
-    return system
+def mock_session() -> Mock:
+    """Return mock client session."""
+    return Mock()
 
 
 @pytest.fixture
-def mock_client(mock_system: MagicMock) -> MagicMock:
+def mock_client(mock_system: FakeSystem) -> Mock:
     """Return mock SupermicroRedfishClient."""
-    client = MagicMock()
+    client = Mock(spec_set=CLIENT_SPEC)
     client._host = "192.168.1.100"
 
     # Connection methods
@@ -75,10 +81,10 @@ def mock_client(mock_system: MagicMock) -> MagicMock:
     client.async_get_system = AsyncMock(return_value=mock_system)
 
     # Config
-    client.set_max_concurrent_requests = MagicMock()
+    client.set_max_concurrent_requests = Mock()
 
     # Stats
-    client.stats = MagicMock()
+    client.stats = Mock()
     client.stats.total_requests = 100
     client.stats.cache_hits = 50
     client.stats.errors = 0
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from aiosupermicro.exceptions import AuthenticationError, ConnectionError
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
@@ -12,15 +13,13 @@ from homeassistant.data_entry_flow import FlowResultType
 
 from custom_components.supermicro_redfish.const import CONF_VERIFY_SSL, DOMAIN
 
+from .common import CLIENT_SPEC, FakeSystem
+
 
 @pytest.fixture
-def mock_client_class() -> MagicMock:
+def mock_client_class(mock_system: FakeSystem) -> Mock:
     """Return mock SupermicroRedfishClient class."""
-    mock_system = MagicMock()
-    mock_system.manufacturer = "Supermicro"
-    mock_system.model = "X12DPi-N6"
-
-    mock_client = MagicMock()
+    mock_client = Mock(spec_set=CLIENT_SPEC)
     mock_client.async_connect = AsyncMock()
     mock_client.async_disconnect = AsyncMock()
     mock_client.async_get_system = AsyncMock(return_value=mock_system)
@@ -30,7 +29,7 @@ def mock_client_class() -> MagicMock:
 
 async def test_form_user(
     hass: HomeAssistant,
-    mock_client_class: MagicMock,
+    mock_client_class: Mock,
 ) -> None:
     """Test the user config flow."""
     result = await hass.config_entries.flow.async_init(
@@ -71,21 +70,20 @@ async def test_form_user(
     }
 
 
-async def test_form_invalid_auth(hass: HomeAssistant) -> None:
+async def test_form_invalid_auth(
+    hass: HomeAssistant,
+    mock_client_class: Mock,
+) -> None:
     """Test handling invalid auth."""
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
     )
 
-    from aiosupermicro.exceptions import AuthenticationError
-
-    mock_client = MagicMock()
-    mock_client.async_connect = AsyncMock(side_effect=AuthenticationError("Invalid credentials"))
-    mock_client.async_disconnect = AsyncMock()
+    mock_client_class.async_connect.side_effect = AuthenticationError("Invalid credentials")
 
     with patch(
         "custom_components.supermicro_redfish.config_flow.SupermicroRedfishClient",
-        return_value=mock_client,
+        return_value=mock_client_class,
     ):
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
@@ -101,21 +99,20 @@ async def test_form_invalid_auth(hass: HomeAssistant) -> None:
     assert result["errors"] == {"base": "invalid_auth"}
 
 
-async def test_form_cannot_connect(hass: HomeAssistant) -> None:
+async def test_form_cannot_connect(
+    hass: HomeAssistant,
+    mock_client_class: Mock,
+) -> None:
     """Test handling connection error."""
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
     )
 
-    from aiosupermicro.exceptions import ConnectionError
-
-    mock_client = MagicMock()
-    mock_client.async_connect = AsyncMock(side_effect=ConnectionError("Connection refused"))
-    mock_client.async_disconnect = AsyncMock()
+    mock_client_class.async_connect.side_effect = ConnectionError("Connection refused")
 
     with patch(
         "custom_components.supermicro_redfish.config_flow.SupermicroRedfishClient",
-        return_value=mock_client,
+        return_value=mock_client_class,
     ):
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
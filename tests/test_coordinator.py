@@ -0,0 +1,315 @@
+"""Tests for the Supermicro Redfish coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import math
+from collections.abc import AsyncGenerator
+from dataclasses import replace
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from aiosupermicro.exceptions import ConnectionError
+from aiosupermicro.models import Chassis, License, Manager, NetworkProtocol
+from aiosupermicro.models.oem import LLDP, NTP
+from homeassistant.config_entries import current_entry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import issue_registry as ir
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.supermicro_redfish.const import (
+    CONF_SCAN_INTERVAL,
+    CONF_STATIC_INTERVAL,
+    CONNECTION_ERROR_THRESHOLD,
+    DEFAULT_STATIC_INTERVAL,
+    DOMAIN,
+    STATIC_TTL_MAX_FACTOR,
+)
+from custom_components.supermicro_redfish.coordinator import (
+    SupermicroRedfishCoordinator,
+)
+
+from .common import FakeSystem, FakeValue
+
+
+def _dynamic_data() -> SimpleNamespace:
+    """Return dynamic data as returned by the client."""
+    return SimpleNamespace(
+        thermal=SimpleNamespace(temperatures=[], fans=[]),
+        power=SimpleNamespace(voltages=[]),
+        fan_mode=SimpleNamespace(mode="Standard"),
+        snooping=SimpleNamespace(post_code="00"),
+    )
+
+
+def _static_data(firmware_version: str = "1.0") -> SimpleNamespace:
+    """Return static data as returned by the client."""
+    return SimpleNamespace(
+        system=FakeSystem(),
+        chassis=SimpleNamespace(model="X12DPi-N6"),
+        manager=SimpleNamespace(firmware_version=firmware_version),
+        ntp=SimpleNamespace(is_valid=True),
+        lldp=SimpleNamespace(is_valid=True),
+        license=SimpleNamespace(is_valid=True),
+        network_protocol=SimpleNamespace(is_valid=True),
+    )
+
+
+def _build_model(cls: type) -> Any:
+    """Build a real aiosupermicro model instance without a Redfish payload."""
+    if dataclasses.is_dataclass(cls):
+        return cls(**{field.name: None for field in dataclasses.fields(cls) if field.init})
+    if hasattr(cls, "model_construct"):
+        return cls.model_construct()
+    # Plain classes keep object equality, which the backoff test must catch
+    return object.__new__(cls)
+
+
+def _model_static_data() -> SimpleNamespace:
+    """Return static data built from freshly created aiosupermicro models."""
+    return SimpleNamespace(
+        system=FakeSystem(),
+        chassis=_build_model(Chassis),
+        manager=_build_model(Manager),
+        ntp=_build_model(NTP),
+        lldp=_build_model(LLDP),
+        license=_build_model(License),
+        network_protocol=_build_model(NetworkProtocol),
+    )
+
+
+def _replace_system(static: SimpleNamespace, **changes: object) -> SimpleNamespace:
+    """Return static data with the given system fields changed."""
+    return SimpleNamespace(**{**vars(static), "system": replace(static.system, **changes)})
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant,
+    mock_client: Mock,
+    mock_config_entry: MockConfigEntry,
+) -> AsyncGenerator[SupermicroRedfishCoordinator]:
+    """Return a coordinator for the mock client."""
+    mock_config_entry.add_to_hass(hass)
+    mock_client.async_get_dynamic_data = AsyncMock(return_value=_dynamic_data())
+    mock_client.async_get_static_data = AsyncMock(return_value=_static_data())
+    current_entry.set(mock_config_entry)
+
+    coordinator = SupermicroRedfishCoordinator(hass, mock_config_entry, mock_client)
+    yield coordinator
+    await coordinator.async_shutdown()
+    current_entry.set(None)
+
+
+async def _refresh_static(coordinator: SupermicroRedfishCoordinator) -> None:
+    """Refresh the coordinator as if the static TTL had expired."""
+    coordinator._last_static_update = -math.inf
+    await coordinator.async_refresh()
+
+
+async def test_static_ttl_backs_off_up_to_cap(
+    coordinator: SupermicroRedfishCoordinator,
+) -> None:
+    """Test the static TTL doubles while static data is unchanged, up to the cap."""
+    expected = [
+        DEFAULT_STATIC_INTERVAL,
+        DEFAULT_STATIC_INTERVAL * 2,
+        DEFAULT_STATIC_INTERVAL * 4,
+        DEFAULT_STATIC_INTERVAL * STATIC_TTL_MAX_FACTOR,
+    ]
+    for ttl in expected:
+        await _refresh_static(coordinator)
+        assert coordinator.last_update_success
+        assert coordinator._static_ttl == ttl
+
+
+async def test_static_ttl_resets_when_static_data_changes(
+    coordinator: SupermicroRedfishCoordinator,
+    mock_client: Mock,
+) -> None:
+    """Test the static TTL returns to the base interval when static data changes."""
+    await _refresh_static(coordinator)
+    await _refresh_static(coordinator)
+    assert coordinator._static_ttl == DEFAULT_STATIC_INTERVAL * 2
+
+    mock_client.async_get_static_data.return_value = _static_data("2.0")
+    await _refresh_static(coordinator)
+    assert coordinator._static_ttl == DEFAULT_STATIC_INTERVAL
+
+
+async def test_static_ttl_backs_off_with_aiosupermicro_models(
+    coordinator: SupermicroRedfishCoordinator,
+    mock_client: Mock,
+) -> None:
+    """Test the backoff works with real models, which must compare by value."""
+    mock_client.async_get_static_data = AsyncMock(side_effect=_model_static_data)
+    await _refresh_static(coordinator)
+    await _refresh_static(coordinator)
+    # Each refresh returned new instances, so only value equality backs off
+    assert coordinator._static_ttl == DEFAULT_STATIC_INTERVAL * 2
+
+
+async def test_system_changes_do_not_reset_backoff(
+    coordinator: SupermicroRedfishCoordinator,
+    mock_client: Mock,
+) -> None:
+    """Test system changes do not reset the backoff of other static data."""
+    await _refresh_static(coordinator)
+    mock_client.async_get_static_data.return_value = _replace_system(
+        _static_data(), power_state=FakeValue("Off")
+    )
+    await _refresh_static(coordinator)
+    # Only the system changed, so the rest of the static data still backs off
+    assert coordinator._static_ttl == DEFAULT_STATIC_INTERVAL * 2
+
+
+async def test_system_refreshed_while_static_data_backs_off(
+    coordinator: SupermicroRedfishCoordinator,
+    mock_client: Mock,
+) -> None:
+    """Test the system is refreshed every static interval during backoff."""
+    await _refresh_static(coordinator)
+    await _refresh_static(coordinator)
+    static_calls = mock_client.async_get_static_data.await_count
+    version = coordinator.static_version
+
+    powered_off = FakeSystem(power_state=FakeValue("Off"))
+    mock_client.async_get_system = AsyncMock(return_value=powered_off)
+    coordinator._last_system_update = -math.inf
+    await coordinator.async_refresh()
+
+    assert coordinator.data.system is powered_off
+    assert coordinator.static_version == version + 1
+    assert mock_client.async_get_static_data.await_count == static_calls
+
+
+async def test_burst_mode_resets_static_ttl(
+    coordinator: SupermicroRedfishCoordinator,
+) -> None:
+    """Test enabling burst mode resets the static TTL."""
+    await _refresh_static(coordinator)
+    await _refresh_static(coordinator)
+    assert coordinator._static_ttl > DEFAULT_STATIC_INTERVAL
+
+    coordinator.enable_burst_mode()
+    assert coordinator._static_ttl == DEFAULT_STATIC_INTERVAL
+
+    coordinator._burst_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await coordinator._burst_task
+
+
+async def test_refresh_static_data_resets_static_ttl(
+    coordinator: SupermicroRedfishCoordinator,
+) -> None:
+    """Test forcing a static refresh resets the static TTL."""
+    await _refresh_static(coordinator)
+    await _refresh_static(coordinator)
+    assert coordinator._static_ttl > DEFAULT_STATIC_INTERVAL
+
+    await coordinator.async_refresh_static_data()
+    assert coordinator._static_ttl == DEFAULT_STATIC_INTERVAL
+    assert coordinator._should_update_static_data()
+
+
+async def test_burst_mode_stops_at_expected_state(
+    coordinator: SupermicroRedfishCoordinator,
+    mock_client: Mock,
+) -> None:
+    """Test burst mode ends as soon as the expected state is reported."""
+    await coordinator.async_refresh()
+    unsub = coordinator.async_add_listener(lambda: None)
+    coordinator._burst_interval = 0
+    calls = mock_client.async_get_dynamic_data.await_count
+
+    coordinator.enable_burst_mode(lambda data: data.fan_mode.mode == "Standard")
+    await coordinator._burst_task
+    unsub()
+
+    assert mock_client.async_get_dynamic_data.await_count == calls + 1
+
+
+async def test_dynamic_data_fetch_is_shared(
+    hass: HomeAssistant,
+    coordinator: SupermicroRedfishCoordinator,
+    mock_client: Mock,
+) -> None:
+    """Test overlapping refreshes share one dynamic data request."""
+    release = asyncio.Event()
+    dynamic = _dynamic_data()
+
+    async def _fetch() -> SimpleNamespace:
+        await release.wait()
+        return dynamic
+
+    mock_client.async_get_dynamic_data = AsyncMock(side_effect=_fetch)
+
+    first = hass.async_create_task(coordinator._async_get_dynamic_data())
+    second = hass.async_create_task(coordinator._async_get_dynamic_data())
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first is dynamic
+    assert await second is dynamic
+    mock_client.async_get_dynamic_data.assert_called_once()
+
+
+async def test_update_options_applies_intervals(
+    coordinator: SupermicroRedfishCoordinator,
+) -> None:
+    """Test updated options are applied without reloading the entry."""
+    coordinator.update_options({CONF_SCAN_INTERVAL: 60, CONF_STATIC_INTERVAL: 600})
+
+    assert coordinator.update_interval == timedelta(seconds=60)
+    assert coordinator._static_ttl == 600
+
+
+async def test_repair_issue_deleted_after_recovery(
+    hass: HomeAssistant,
+    coordinator: SupermicroRedfishCoordinator,
+    mock_client: Mock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test the connection repair issue is created and removed on recovery."""
+    issue_id = f"connection_failed_{mock_config_entry.entry_id}"
+    issue_registry = ir.async_get(hass)
+    dynamic = mock_client.async_get_dynamic_data.return_value
+
+    mock_client.async_get_dynamic_data.side_effect = ConnectionError("Connection refused")
+    for _ in range(CONNECTION_ERROR_THRESHOLD):
+        await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert issue_registry.async_get_issue(DOMAIN, issue_id) is not None
+
+    mock_client.async_get_dynamic_data.side_effect = None
+    mock_client.async_get_dynamic_data.return_value = dynamic
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert issue_registry.async_get_issue(DOMAIN, issue_id) is None
+
+
+async def test_repair_issue_from_before_restart_deleted(
+    hass: HomeAssistant,
+    coordinator: SupermicroRedfishCoordinator,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test a persisted repair issue is removed by the first successful update."""
+    issue_id = f"connection_failed_{mock_config_entry.entry_id}"
+    issue_registry = ir.async_get(hass)
+    ir.async_create_issue(
+        hass,
+        DOMAIN,
+        issue_id,
+        is_fixable=True,
+        is_persistent=True,
+        severity=ir.IssueSeverity.ERROR,
+        translation_key="connection_failed",
+    )
+
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert issue_registry.async_get_issue(DOMAIN, issue_id) is None
@@ -2,77 +2,126 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Mapping
+from typing import Any
+from unittest.mock import AsyncMock, Mock
 
 import pytest
+from aiosupermicro.exceptions import AuthenticationError, ConnectionError
+from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.supermicro_redfish.const import DOMAIN
-
-
-async def test_setup_entry_auth_failed(
+from custom_components.supermicro_redfish import async_setup_entry, async_update_options
+from custom_components.supermicro_redfish.const import (
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_SCAN_INTERVAL,
+    DOMAIN,
+)
+from custom_components.supermicro_redfish.data import SupermicroRedfishRuntimeData
+
+
+@pytest.fixture(autouse=True)
+def mock_setup(
+    monkeypatch: pytest.MonkeyPatch, mock_client: Mock, mock_session: Mock
+) -> Mock:
+    """Patch the client and client session used by async_setup_entry."""
+    monkeypatch.setattr(
+        "custom_components.supermicro_redfish.SupermicroRedfishClient",
+        lambda *_args, **_kwargs: mock_client,
+    )
+    monkeypatch.setattr(
+        "custom_components.supermicro_redfish.async_get_clientsession",
+        lambda *_args, **_kwargs: mock_session,
+    )
+    return mock_client
+
+
+@pytest.mark.parametrize(
+    ("exception", "expected"),
+    [
+        (AuthenticationError("Invalid credentials"), ConfigEntryAuthFailed),
+        (ConnectionError("Connection refused"), ConfigEntryNotReady),
+    ],
+    ids=["auth_failed", "connection_failed"],
+)
+async def test_setup_entry_failed(
     hass: HomeAssistant,
-    mock_client: MagicMock,
-    mock_config_entry_data: dict,
+    mock_client: Mock,
+    mock_config_entry: MockConfigEntry,
+    exception: Exception,
+    expected: type[Exception],
 ) -> None:
-    """Test setup entry with authentication failure."""
-    from aiosupermicro.exceptions import AuthenticationError
+    """Test setup entry with authentication and connection failures."""
+
+    async def _connect() -> None:
+        raise exception
 
-    mock_client.async_connect = AsyncMock(side_effect=AuthenticationError("Invalid credentials"))
+    mock_client.async_connect = _connect
 
+    with pytest.raises(expected):
+        await async_setup_entry(hass, mock_config_entry)
+
+    mock_client.async_disconnect.assert_awaited_once()
+
+
+def _options_entry(
+    client: Mock, data: Mapping[str, Any], entry_data: Mapping[str, Any]
+) -> MockConfigEntry:
+    """Return an entry with changed options and runtime data from before the change."""
     entry = MockConfigEntry(
         domain=DOMAIN,
-        title="Test",
-        data=mock_config_entry_data,
+        data=data,
+        options={CONF_MAX_CONCURRENT_REQUESTS: 4, CONF_SCAN_INTERVAL: 60},
+    )
+    entry.runtime_data = SupermicroRedfishRuntimeData(
+        client=client,
+        coordinator=Mock(spec_set=["update_options"]),
+        entry_data=dict(entry_data),
+        entry_options={},
     )
-    entry.add_to_hass(hass)
+    return entry
 
-    with (
-        patch(
-            "custom_components.supermicro_redfish.SupermicroRedfishClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.supermicro_redfish.async_get_clientsession",
-            return_value=MagicMock(),
-        ),
-        pytest.raises(ConfigEntryAuthFailed),
-    ):
-        from custom_components.supermicro_redfish import async_setup_entry
 
-        await async_setup_entry(hass, entry)
+async def test_update_options_applied_live(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_client: Mock,
+    mock_config_entry_data: Mapping[str, Any],
+) -> None:
+    """Test option changes are applied to the running entry without a reload."""
+    reload = AsyncMock()
+    monkeypatch.setattr(hass.config_entries, "async_reload", reload)
+    entry = _options_entry(mock_client, mock_config_entry_data, mock_config_entry_data)
+
+    await async_update_options(hass, entry)
+
+    reload.assert_not_awaited()
+    mock_client.set_max_concurrent_requests.assert_called_once_with(4)
+    entry.runtime_data.coordinator.update_options.assert_called_once_with(
+        dict(entry.options)
+    )
+    assert entry.runtime_data.entry_options == dict(entry.options)
 
 
-async def test_setup_entry_connection_failed(
+async def test_update_options_reloads_on_data_change(
     hass: HomeAssistant,
-    mock_client: MagicMock,
-    mock_config_entry_data: dict,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_client: Mock,
+    mock_config_entry_data: Mapping[str, Any],
 ) -> None:
-    """Test setup entry with connection failure."""
-    from aiosupermicro.exceptions import ConnectionError
+    """Test changed connection settings reload the entry."""
+    reload = AsyncMock()
+    monkeypatch.setattr(hass.config_entries, "async_reload", reload)
+    entry = _options_entry(
+        mock_client,
+        mock_config_entry_data,
+        {**mock_config_entry_data, CONF_HOST: "192.168.1.101"},
+    )
 
-    mock_client.async_connect = AsyncMock(side_effect=ConnectionError("Connection refused"))
+    await async_update_options(hass, entry)
 
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        title="Test",
-        data=mock_config_entry_data,
-    )
-    entry.add_to_hass(hass)
-
-    with (
-        patch(
-            "custom_components.supermicro_redfish.SupermicroRedfishClient",
-            return_value=mock_client,
-        ),
-        patch(
-            "custom_components.supermicro_redfish.async_get_clientsession",
-            return_value=MagicMock(),
-        ),
-        pytest.raises(ConfigEntryNotReady),
-    ):
-        from custom_components.supermicro_redfish import async_setup_entry
-
-        await async_setup_entry(hass, entry)
+    reload.assert_awaited_once_with(entry.entry_id)
+    mock_client.set_max_concurrent_requests.assert_not_called()
+    entry.runtime_data.coordinator.update_options.assert_not_called()